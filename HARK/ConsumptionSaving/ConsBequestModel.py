@@ -10,8 +10,6 @@ It currently solves two types of models:
     2) A portfolio choice model with a terminal and/or accidental bequest motive.
 """
 
-from copy import deepcopy
-
 import numpy as np
 
 from HARK import NullFunc
@@ -588,7 +586,7 @@ def solve_one_period_ConsPortfolioWarmGlow(
 
         if AdjustPrb < 1.0:
             # Expand to the same dimensions as mNrm
-            Share_next_expanded = z + np.zeros_like(mNrm_next)
+            Share_next_expanded = np.broadcast_to(z, mNrm_next.shape)
             dvdmFxd_next = dvdmFuncFxd_next(mNrm_next, Share_next_expanded)
             # Combine by adjustment probability
             dvdm_next = AdjustPrb * dvdmAdj_next + (1.0 - AdjustPrb) * dvdmFxd_next
@@ -611,7 +609,7 @@ def solve_one_period_ConsPortfolioWarmGlow(
 
         if AdjustPrb < 1.0:
             # Expand to the same dimensions as mNrm
-            Share_next_expanded = z + np.zeros_like(mNrm_next)
+            Share_next_expanded = np.broadcast_to(z, mNrm_next.shape)
             dvdsFxd_next = dvdsFuncFxd_next(mNrm_next, Share_next_expanded)
             # Combine by adjustment probability
             dvds_next = AdjustPrb * dvdsAdj_next + (1.0 - AdjustPrb) * dvdsFxd_next
@@ -650,7 +648,7 @@ def solve_one_period_ConsPortfolioWarmGlow(
         bNrm_next = Rport * a
 
         # Ensure shape concordance
-        z_rep = z + np.zeros_like(bNrm_next)
+        z_rep = np.broadcast_to(z, bNrm_next.shape)
 
         # Calculate and return dvda
         EndOfPrd_dvda = Rport * dvdbFunc_intermed(bNrm_next, z_rep)
@@ -667,7 +665,7 @@ def solve_one_period_ConsPortfolioWarmGlow(
         bNrm_next = Rport * a
 
         # Make the shares match the dimension of b, so that it can be vectorized
-        z_rep = z + np.zeros_like(bNrm_next)
+        z_rep = np.broadcast_to(z, bNrm_next.shape)
 
         # Calculate and return dvds
         EndOfPrd_dvds = Rxs * a * dvdbFunc_intermed(
@@ -727,7 +725,7 @@ def solve_one_period_ConsPortfolioWarmGlow(
 
             # Make an extended share_next of the same dimension as b_nrm so
             # that the function can be vectorized
-            z_rep = z + np.zeros_like(bNrm_next)
+            z_rep = np.broadcast_to(z, bNrm_next.shape)
 
             EndOfPrd_v = vFunc_intermed(bNrm_next, z_rep)
             return EndOfPrd_v
@@ -857,10 +855,10 @@ def solve_one_period_ConsPortfolioWarmGlow(
     # This is a point at which (a,c,share) have consistent length. Take the
     # snapshot for storing the grid and values in the solution.
     save_points = {
-        "a": deepcopy(aNrmGrid),
+        "a": aNrmGrid.copy(),
         "eop_dvda_adj": uFunc.der(cNrmAdj_now),
-        "share_adj": deepcopy(ShareAdj_now),
-        "share_grid": deepcopy(ShareGrid),
+        "share_adj": ShareAdj_now.copy(),
+        "share_grid": ShareGrid.copy(),
         "eop_dvda_fxd": uFunc.der(EndOfPrd_dvda),
         "eop_dvds_fxd": EndOfPrd_dvds,
     }
@@ -888,7 +886,11 @@ def solve_one_period_ConsPortfolioWarmGlow(
         vFuncAdj_now = ValueFuncCRRA(vNvrsFuncAdj, CRRA)
 
         # Construct the value function when the agent *can't* adjust his portfolio
-        mNrm_temp, Share_temp = np.meshgrid(aXtraGrid, ShareGrid)
+        # Broadcast views over (aXtraGrid, ShareGrid), one column per share
+        mNrm_temp = np.broadcast_to(
+            aXtraGrid[:, np.newaxis], (aXtraGrid.size, ShareCount)
+        )
+        Share_temp = np.broadcast_to(ShareGrid[np.newaxis, :], mNrm_temp.shape)
         cNrm_temp = cFuncFxd_now(mNrm_temp, Share_temp)
         aNrm_temp = mNrm_temp - cNrm_temp
         v_temp = uFunc(cNrm_temp) + EndOfPrd_vFunc(aNrm_temp, Share_temp)
@@ -898,9 +900,9 @@ def solve_one_period_ConsPortfolioWarmGlow(
         for j in range(ShareCount):
             vNvrsFuncFxd_by_Share.append(
                 CubicInterp(
-                    np.insert(mNrm_temp[:, 0], 0, 0.0),  # x_list
+                    np.insert(aXtraGrid, 0, 0.0),  # x_list
                     np.insert(vNvrs_temp[:, j], 0, 0.0),  # f_list
-                    np.insert(vNvrsP_temp[:, j], 0, vNvrsP_temp[j, 0]),  # dfdx_list
+                    np.insert(vNvrsP_temp[:, j], 0, vNvrsP_temp[0, j]),  # dfdx_list
                 )
             )
         vNvrsFuncFxd = LinearInterpOnInterp1D(vNvrsFuncFxd_by_Share, ShareGrid)
@@ -4,9 +4,12 @@ agents who must allocate their resources among consumption, saving in a risk-fre
 asset (with a low return), and saving in a risky asset (with higher average return).
 """
 
+import os
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 
 import numpy as np
+from numba import njit, prange
 
 from HARK import NullFunc
 from HARK.ConsumptionSaving.ConsIndShockModel import (
@@ -15,8 +18,8 @@ from HARK.ConsumptionSaving.ConsIndShockModel import (
 )
 from HARK.ConsumptionSaving.ConsRiskyAssetModel import RiskyAssetConsumerType
 from HARK.distribution import expected
+from HARK.econforgeinterp import LinearFast
 from HARK.interpolation import (
-    BilinearInterp,
     ConstantFunction,
     CubicInterp,
     IdentityFunction,
@@ -28,6 +31,699 @@ from HARK.interpolation import (
 from HARK.metric import MetricObject
 from HARK.rewards import UtilityFuncCRRA
 
+# Minimum number of simulated agents for which get_controls evaluates the policy
+# functions for different periods of the cycle in parallel threads
+_THREADED_CONTROLS_MIN_AGENTS = 100000
+
+# The fixed-share policy is the same stateless function in every period
+_ShareFuncFxd = IdentityFunction(i_dim=1, n_dims=2)
+
+
+@njit(cache=True, parallel=True)
+def _calc_mNrm_next(bNrm, PermShk, TranShk, PermGroFac):
+    """
+    Calculate future realizations of market resources mNrm at every combination
+    of normalized bank balances bNrm and income shock atoms (PermShk, TranShk).
+    Returns an array of shape (bNrm.size, PermShk.size).
+    """
+    mNrm_next = np.empty((bNrm.size, PermShk.size))
+    for i in prange(bNrm.size):
+        for k in range(PermShk.size):
+            mNrm_next[i, k] = bNrm[i] / (PermShk[k] * PermGroFac) + TranShk[k]
+    return mNrm_next
+
+
+def _CRRAutilityP_inv_inplace(uP, CRRA):
+    """
+    Invert CRRA marginal utility uP in place, overwriting the array uP with the
+    corresponding consumption levels, and return it.
+    """
+    return np.power(uP, -1.0 / CRRA, out=uP)
+
+
+def _CRRAutility_inv_inplace(u, CRRA):
+    """
+    Invert CRRA utility u in place, overwriting the array u with the corresponding
+    consumption levels, and return it.
+    """
+    if CRRA == 1:
+        return np.exp(u, out=u)
+    u *= 1.0 - CRRA
+    return np.power(u, 1 / (1.0 - CRRA), out=u)
+
+
+@njit(cache=True, parallel=True)
+def _calc_EndOfPrd_Nvrs(EndOfPrd_dvda, EndOfPrd_v, CRRA):
+    """
+    Invert CRRA marginal utility at end-of-period marginal value of assets, and
+    CRRA utility at end-of-period value, in one pass over the 2D arrays. Also
+    returns the derivative of the pseudo-inverse value function with respect to
+    assets. Returns three arrays with the same shape as the inputs.
+    """
+    aNrmCount, ShareCount = EndOfPrd_dvda.shape
+    EndOfPrd_dvdaNvrs = np.empty((aNrmCount, ShareCount))
+    EndOfPrd_vNvrs = np.empty((aNrmCount, ShareCount))
+    EndOfPrd_vNvrsP = np.empty((aNrmCount, ShareCount))
+    for i in prange(aNrmCount):
+        for j in range(ShareCount):
+            dvda = EndOfPrd_dvda[i, j]
+            EndOfPrd_dvdaNvrs[i, j] = dvda ** (-1.0 / CRRA)
+            if CRRA == 1.0:
+                vNvrs = np.exp(EndOfPrd_v[i, j])
+                EndOfPrd_vNvrs[i, j] = vNvrs
+                EndOfPrd_vNvrsP[i, j] = dvda * vNvrs
+            else:
+                temp = (1.0 - CRRA) * EndOfPrd_v[i, j]
+                EndOfPrd_vNvrs[i, j] = temp ** (1 / (1.0 - CRRA))
+                EndOfPrd_vNvrsP[i, j] = dvda * temp ** (CRRA / (1.0 - CRRA))
+    return EndOfPrd_dvdaNvrs, EndOfPrd_vNvrs, EndOfPrd_vNvrsP
+
+
+def _make_LinearInterp_table(funcs):
+    """
+    Stack the gridpoints and extrapolation parameters of a list of LinearInterp
+    objects into arrays with one row per function, padding shorter grids, so that
+    they can all be evaluated by _eval_LinearInterp_table in a single call.
+    """
+    x_n = np.array([f.x_n for f in funcs])
+    x_tab = np.zeros((len(funcs), np.max(x_n)))
+    y_tab = np.zeros((len(funcs), np.max(x_n)))
+    for t, f in enumerate(funcs):
+        x_tab[t, : f.x_n] = f.x_list
+        y_tab[t, : f.x_n] = f.y_list
+    lower_extrap = np.array([f.lower_extrap for f in funcs], dtype=bool)
+    decay_extrap = np.array([f.decay_extrap for f in funcs], dtype=bool)
+    decay_params = np.zeros((4, len(funcs)))
+    for t, f in enumerate(funcs):
+        if f.decay_extrap:
+            decay_params[:, t] = [
+                np.squeeze(f.intercept_limit),
+                np.squeeze(f.slope_limit),
+                np.squeeze(f.decay_extrap_A),
+                np.squeeze(f.decay_extrap_B),
+            ]
+    intercept_limit, slope_limit, decay_A, decay_B = decay_params
+    return (
+        x_tab,
+        y_tab,
+        x_n,
+        lower_extrap,
+        decay_extrap,
+        intercept_limit,
+        slope_limit,
+        decay_A,
+        decay_B,
+    )
+
+
+@njit(cache=True)
+def _locate_LinearInterp(x_list, x, lower_extrap=False):
+    """
+    Find the segment of a LinearInterp with gridpoints x_list that is used at the
+    scalar x, following the same rules as LinearInterp without decay extrapolation.
+    Returns the index i of the top gridpoint of the segment and the relative
+    position alpha of x within it, which is NaN below the grid unless lower_extrap
+    is True. The pair can be passed to _apply_LinearInterp for any number of
+    functions on the same gridpoints.
+    """
+    i = max(np.searchsorted(x_list[:-1], x), 1)
+    alpha = (x - x_list[i - 1]) / (x_list[i] - x_list[i - 1])
+    if (not lower_extrap) and x < x_list[0]:
+        alpha = np.nan
+    return i, alpha
+
+
+@njit(cache=True)
+def _apply_LinearInterp(y_list, i, alpha):
+    """
+    Interpolate y_list on the segment found by _locate_LinearInterp.
+    """
+    return (1.0 - alpha) * y_list[i - 1] + alpha * y_list[i]
+
+
+@njit(cache=True)
+def _eval_LinearInterp(x_list, y_list, x, lower_extrap=False):
+    """
+    Evaluate a LinearInterp with gridpoints x_list and y_list at the scalar x,
+    following the same rules as LinearInterp without decay extrapolation: linear
+    extrapolation above the grid, and NaN below it unless lower_extrap is True.
+    """
+    i, alpha = _locate_LinearInterp(x_list, x, lower_extrap)
+    return _apply_LinearInterp(y_list, i, alpha)
+
+
+@njit(cache=True, parallel=True)
+def _eval_LinearInterp_table(
+    x_tab,
+    y_tab,
+    x_n,
+    lower_extrap,
+    decay_extrap,
+    intercept_limit,
+    slope_limit,
+    decay_A,
+    decay_B,
+    t_idx,
+    x,
+):
+    """
+    Evaluate the t_idx[k]-th function of a table made by _make_LinearInterp_table
+    at x[k] for every k, following the same rules as LinearInterp.
+    """
+    y = np.empty(x.size)
+    for k in prange(x.size):
+        t = t_idx[k]
+        n = x_n[t]
+        x_list = x_tab[t, :n]
+        y[k] = _eval_LinearInterp(x_list, y_tab[t, :n], x[k], lower_extrap[t])
+        if decay_extrap[t] and x[k] > x_list[-1]:
+            y[k] = (
+                intercept_limit[t]
+                + slope_limit[t] * x[k]
+                - decay_A[t] * np.exp(-decay_B[t] * (x[k] - x_list[-1]))
+            )
+    return y
+
+
+def _calc_exp_by_bz(vAdj_next, vFxd_intermed, weights, AdjustPrb, ShareCount):
+    """
+    Take expectations of next period (marginal) values for agents who can adjust
+    their share across income shocks, then combine them with the expectation for
+    agents who can't (already taken) by the adjustment probability. The result
+    has shape (bNrm.size, ShareCount).
+    """
+    vAdj_intermed = np.dot(vAdj_next, weights)
+    v_intermed = np.repeat(vAdj_intermed[:, np.newaxis], ShareCount, axis=1)
+    if AdjustPrb < 1.0:
+        v_intermed = AdjustPrb * v_intermed + (1.0 - AdjustPrb) * vFxd_intermed
+    return v_intermed
+
+
+def _get_Fxd_tables(solution_next, ShareGrid):
+    """
+    Extract the gridpoints of next period's consumption and marginal value of
+    share functions for agents who can't adjust, if these are linear interpolants
+    in mNrm at each point of ShareGrid sharing the same mNrm gridpoints (as made
+    by solve_one_period_ConsPortfolio). Returns arrays of mNrm, cNrm, and dvds
+    with one row per share and the CRRA of dvdmFuncFxd, or None if the functions
+    have any other form.
+    """
+    dvdmFunc = solution_next.dvdmFuncFxd
+    dvdsFunc = solution_next.dvdsFuncFxd
+    if not isinstance(dvdmFunc, MargValueFuncCRRA):
+        return None
+    cFunc = dvdmFunc.cFunc
+    for func in (cFunc, dvdsFunc):
+        if type(func) is not LinearInterpOnInterp1D or not np.array_equal(
+            func.y_list, ShareGrid
+        ):
+            return None
+        for f in func.xInterpolators:
+            if type(f) is not LinearInterp or f.lower_extrap or f.decay_extrap:
+                return None
+        if len(set(f.x_n for f in func.xInterpolators)) > 1:
+            return None
+
+    mNrm_tab = np.array([f.x_list for f in cFunc.xInterpolators])
+    if not np.array_equal(mNrm_tab, [f.x_list for f in dvdsFunc.xInterpolators]):
+        return None
+    cNrm_tab = np.array([f.y_list for f in cFunc.xInterpolators])
+    dvds_tab = np.array([f.y_list for f in dvdsFunc.xInterpolators])
+    return mNrm_tab, cNrm_tab, dvds_tab, dvdmFunc.CRRA
+
+
+@njit(cache=True, parallel=True)
+def _calc_exp_Fxd_by_bz(
+    mNrm_next, mNrm_tab, cNrm_tab, dvds_tab, CRRA, weights_dvdm, weights_dvds
+):
+    """
+    Take expectations across income shocks of next period's marginal value of
+    market resources and of risky share for agents who can't adjust their share,
+    at every combination of bNrm and the shares in the rows of the tables from
+    _get_Fxd_tables. mNrm_next has shape (bNrm.size, IncShk atoms) and the
+    weights hold the income shock probabilities times the permanent shock
+    scaling factors. Both marginal values are interpolated with the same
+    gridpoint lookup. Returns two arrays of shape (bNrm.size, ShareCount).
+    """
+    bNrmCount, IncShkCount = mNrm_next.shape
+    ShareCount = mNrm_tab.shape[0]
+    dvdm_exp = np.zeros((bNrmCount, ShareCount))
+    dvds_exp = np.zeros((bNrmCount, ShareCount))
+    for i in prange(bNrmCount):
+        for j in range(ShareCount):
+            x_list = mNrm_tab[j]
+            for k in range(IncShkCount):
+                idx, alpha = _locate_LinearInterp(x_list, mNrm_next[i, k])
+                c = _apply_LinearInterp(cNrm_tab[j], idx, alpha)
+                dvds = _apply_LinearInterp(dvds_tab[j], idx, alpha)
+                dvdm_exp[i, j] += weights_dvdm[k] * c ** (-CRRA)
+                dvds_exp[i, j] += weights_dvds[k] * dvds
+    return dvdm_exp, dvds_exp
+
+
+def _get_Adj_table(solution_next):
+    """
+    Extract the gridpoints of next period's consumption function for agents who
+    can adjust their share, if it is a linear interpolant without extrapolation
+    (as made by solve_one_period_ConsPortfolio). Returns arrays of mNrm and cNrm
+    and the CRRA of vPfuncAdj, or None if the function has any other form.
+    """
+    vPfunc = solution_next.vPfuncAdj
+    if not isinstance(vPfunc, MargValueFuncCRRA):
+        return None
+    cFunc = vPfunc.cFunc
+    if type(cFunc) is not LinearInterp or cFunc.lower_extrap or cFunc.decay_extrap:
+        return None
+    return cFunc.x_list, cFunc.y_list, vPfunc.CRRA
+
+
+@njit(cache=True, parallel=True)
+def _calc_EndOfPrd_dvdx_joint_tab(
+    aNrmGrid,
+    ShareGrid,
+    PermShkVals,
+    TranShkVals,
+    RiskyVals,
+    ShkPrbs,
+    Rfree,
+    PermGroFac,
+    CRRA,
+    AdjustPrb,
+    mNrmAdj_tab,
+    cNrmAdj_tab,
+    CRRA_Adj,
+    mNrm_tab,
+    cNrm_tab,
+    dvds_tab,
+    CRRA_Fxd,
+):
+    """
+    Compute end-of-period marginal value of assets and risky share at every
+    combination of aNrmGrid and ShareGrid by taking expectations over the atoms
+    of a joint distribution of permanent, transitory, and risky return shocks.
+    Next period's marginal values are interpolated from the tables made by
+    _get_Adj_table and _get_Fxd_tables, so no array over all shock realizations
+    is built. Returns two arrays of shape (aNrmGrid.size, ShareGrid.size).
+    """
+    aNrmCount = aNrmGrid.size
+    ShareCount = ShareGrid.size
+    EndOfPrd_dvda = np.zeros((aNrmCount, ShareCount))
+    EndOfPrd_dvds = np.zeros((aNrmCount, ShareCount))
+
+    # Only compute the power of the permanent shock once for each atom
+    RxsVals = RiskyVals - Rfree
+    PermGroShkVals = PermShkVals * PermGroFac
+    PermGroShkPowVals = PermGroShkVals ** (-CRRA)
+    for i in prange(aNrmCount):
+        for j in range(ShareCount):
+            x_list = mNrm_tab[j]
+            for k in range(ShkPrbs.size):
+                Rxs = RxsVals[k]
+                Rport = Rfree + ShareGrid[j] * Rxs
+                bNrm_next = Rport * aNrmGrid[i]
+                PermGroShk = PermGroShkVals[k]
+                PermGroShkPow = PermGroShkPowVals[k]
+                m = bNrm_next / PermGroShk + TranShkVals[k]
+
+                c = _eval_LinearInterp(mNrmAdj_tab, cNrmAdj_tab, m)
+                dvdm_next = c ** (-CRRA_Adj)
+
+                if AdjustPrb < 1.0:
+                    # Both fixed share tables are on the same gridpoints, so the
+                    # segment containing m only needs to be found once
+                    idx, alpha = _locate_LinearInterp(x_list, m)
+                    c = _apply_LinearInterp(cNrm_tab[j], idx, alpha)
+                    dvds = _apply_LinearInterp(dvds_tab[j], idx, alpha)
+                    dvdm_next = AdjustPrb * dvdm_next + (1.0 - AdjustPrb) * c ** (
+                        -CRRA_Fxd
+                    )
+                    dvds_next = (1.0 - AdjustPrb) * dvds
+                    dvdm_next = PermGroShkPow * dvdm_next
+                    dvds_now = (
+                        Rxs * aNrmGrid[i] * dvdm_next
+                        + PermGroShk * PermGroShkPow * dvds_next
+                    )
+                else:
+                    dvdm_next = PermGroShkPow * dvdm_next
+                    dvds_now = Rxs * aNrmGrid[i] * dvdm_next
+                EndOfPrd_dvda[i, j] += ShkPrbs[k] * Rport * dvdm_next
+                EndOfPrd_dvds[i, j] += ShkPrbs[k] * dvds_now
+    return EndOfPrd_dvda, EndOfPrd_dvds
+
+
+def _get_vFxd_tables(solution_next, ShareGrid):
+    """
+    Extract the gridpoints and coefficients of next period's value function for
+    agents who can't adjust, if it is a re-curved cubic interpolant in mNrm at
+    each point of ShareGrid sharing the same mNrm gridpoints (as made by
+    solve_one_period_ConsPortfolio). Returns the mNrm gridpoints, an array of
+    CubicInterp coefficients with one block per share, the pseudo-inverse value
+    at the bottom gridpoint for each share, and the CRRA of vFuncFxd; or None
+    if the function has any other form.
+    """
+    vFunc = solution_next.vFuncFxd
+    if not isinstance(vFunc, ValueFuncCRRA):
+        return None
+    vNvrsFunc = vFunc.vFuncNvrs
+    if type(vNvrsFunc) is not LinearInterpOnInterp1D or not np.array_equal(
+        vNvrsFunc.y_list, ShareGrid
+    ):
+        return None
+    funcs = vNvrsFunc.xInterpolators
+    if any(type(f) is not CubicInterp for f in funcs):
+        return None
+    x_list = funcs[0].x_list
+    if any(not np.array_equal(f.x_list, x_list) for f in funcs):
+        return None
+
+    coeffs = np.array([f.coeffs for f in funcs])
+    vNvrs_bot = np.array([f.y_list[0] for f in funcs])
+    return x_list, coeffs, vNvrs_bot, vFunc.CRRA
+
+
+@njit(cache=True)
+def _eval_vFxd_table(x_list, coeffs, vNvrs_bot, CRRA, m):
+    """
+    Evaluate one share's block of the tables from _get_vFxd_tables at market
+    resources m, following CubicInterp and ValueFuncCRRA.
+    """
+    n = x_list.size
+    pos = np.searchsorted(x_list, m)
+    if pos == 0:
+        vNvrs = coeffs[0, 0] + coeffs[0, 1] * (m - x_list[0])
+    elif pos < n:
+        alpha = (m - x_list[pos - 1]) / (x_list[pos] - x_list[pos - 1])
+        vNvrs = coeffs[pos, 0] + alpha * (
+            coeffs[pos, 1] + alpha * (coeffs[pos, 2] + alpha * coeffs[pos, 3])
+        )
+    else:
+        alpha = m - x_list[n - 1]
+        vNvrs = (
+            coeffs[n, 0]
+            + m * coeffs[n, 1]
+            - coeffs[n, 2] * np.exp(alpha * coeffs[n, 3])
+        )
+    if m == x_list[0]:
+        vNvrs = vNvrs_bot
+    if CRRA == 1.0:
+        return np.log(vNvrs)
+    return vNvrs ** (1.0 - CRRA) / (1.0 - CRRA)
+
+
+@njit(cache=True, parallel=True)
+def _calc_exp_vFxd_by_bz(mNrm_next, x_list, coeffs, vNvrs_bot, CRRA, weights):
+    """
+    Take expectations across income shocks of next period's value for agents
+    who can't adjust their share, at every combination of bNrm and the shares
+    in the tables from _get_vFxd_tables. mNrm_next has shape (bNrm.size, IncShk
+    atoms) and the weights hold the income shock probabilities times the
+    permanent shock scaling factors. Returns an array of shape
+    (bNrm.size, ShareCount).
+    """
+    bNrmCount, IncShkCount = mNrm_next.shape
+    ShareCount = coeffs.shape[0]
+    v_exp = np.zeros((bNrmCount, ShareCount))
+    for i in prange(bNrmCount):
+        for j in range(ShareCount):
+            for k in range(IncShkCount):
+                v_exp[i, j] += weights[k] * _eval_vFxd_table(
+                    x_list, coeffs[j], vNvrs_bot[j], CRRA, mNrm_next[i, k]
+                )
+    return v_exp
+
+
+@njit(cache=True, parallel=True)
+def _eval_vFxd_tables_by_Share(mNrm_next, x_list, coeffs, vNvrs_bot, CRRA):
+    """
+    Evaluate next period's value for agents who can't adjust their share at
+    realizations mNrm_next of shape (aNrm.size, ShareCount, shock atoms), where
+    the second axis runs over the shares in the tables from _get_vFxd_tables.
+    Returns an array with the same shape as mNrm_next.
+    """
+    aNrmCount, ShareCount, ShkCount = mNrm_next.shape
+    v_next = np.empty((aNrmCount, ShareCount, ShkCount))
+    for i in prange(aNrmCount):
+        for j in range(ShareCount):
+            for k in range(ShkCount):
+                v_next[i, j, k] = _eval_vFxd_table(
+                    x_list, coeffs[j], vNvrs_bot[j], CRRA, mNrm_next[i, j, k]
+                )
+    return v_next
+
+
+@njit(cache=True, parallel=True)
+def _calc_EndOfPrd_dvdx_by_Risky(
+    aNrmGrid,
+    ShareGrid,
+    RiskyVals,
+    RiskyPrbs,
+    Rfree,
+    CRRA,
+    bNrmGrid,
+    dvdbNvrs_by_Share,
+    dvds_by_Share,
+):
+    """
+    Compute end-of-period marginal value of assets and risky share at every
+    combination of aNrmGrid and ShareGrid by taking expectations over risky
+    return atoms RiskyVals. The intermediate (pseudo-inverse) marginal values
+    are passed as tables with one contiguous row of bNrmGrid values per risky
+    share, so each share's row stays in cache while all of its asset levels and
+    return atoms are processed. Because the share is always on ShareGrid, only
+    linear interpolation (and extrapolation) along bNrmGrid is needed.
+    Returns two arrays of shape (aNrmGrid.size, ShareGrid.size).
+    """
+    aNrmCount = aNrmGrid.size
+    ShareCount = ShareGrid.size
+    top = bNrmGrid.size - 1
+    EndOfPrd_dvda = np.zeros((ShareCount, aNrmCount))
+    EndOfPrd_dvds = np.zeros((ShareCount, aNrmCount))
+    for j in prange(ShareCount):
+        dvdbNvrs_row = dvdbNvrs_by_Share[j]
+        dvds_row = dvds_by_Share[j]
+        for k in range(RiskyVals.size):
+            Rxs = RiskyVals[k] - Rfree  # Excess returns
+            Rport = Rfree + ShareGrid[j] * Rxs  # Portfolio return
+            for i in range(aNrmCount):
+                bNrm_next = Rport * aNrmGrid[i]
+                idx = np.searchsorted(bNrmGrid, bNrm_next)
+                idx = min(max(idx, 1), top)
+                alpha = (bNrm_next - bNrmGrid[idx - 1]) / (
+                    bNrmGrid[idx] - bNrmGrid[idx - 1]
+                )
+                dvdbNvrs_next = (1.0 - alpha) * dvdbNvrs_row[
+                    idx - 1
+                ] + alpha * dvdbNvrs_row[idx]
+                dvds_next = (1.0 - alpha) * dvds_row[idx - 1] + alpha * dvds_row[idx]
+                dvdb_next = dvdbNvrs_next ** (-CRRA)
+                EndOfPrd_dvda[j, i] += RiskyPrbs[k] * Rport * dvdb_next
+                EndOfPrd_dvds[j, i] += RiskyPrbs[k] * (
+                    Rxs * aNrmGrid[i] * dvdb_next + dvds_next
+                )
+    return EndOfPrd_dvda.T, EndOfPrd_dvds.T
+
+
+@njit(cache=True, parallel=True)
+def _find_FOC_crossing(FOC_s):
+    """
+    For each row of FOC_s (aNrm by Share), find the index of the first segment
+    of the share grid on which the first order condition flips from positive to
+    negative, i.e. FOC_s[i, k] >= 0 and FOC_s[i, k+1] <= 0. The scan along each
+    row stops at the first crossing; rows without one get index zero.
+    """
+    aNrmCount, ShareCount = FOC_s.shape
+    share_idx = np.zeros(aNrmCount, dtype=np.int64)
+    for i in prange(aNrmCount):
+        for k in range(ShareCount - 1):
+            if FOC_s[i, k] >= 0.0 and FOC_s[i, k + 1] <= 0.0:
+                share_idx[i] = k
+                break
+    return share_idx
+
+
+def _make_CubicInterp_by_Share(x_list, y_by_Share, dydx_by_Share):
+    """
+    Make a list of CubicInterp functions, one per column of y_by_Share and
+    dydx_by_Share, all on gridpoints x_list. The coefficients for every share
+    are computed at once by CubicInterp.calc_coeffs.
+    """
+    coeffs = CubicInterp.calc_coeffs(x_list, y_by_Share.T, dydx_by_Share.T)
+    return [
+        CubicInterp.from_coeffs(
+            x_list, y_by_Share[:, j], dydx_by_Share[:, j], coeffs[j]
+        )
+        for j in range(y_by_Share.shape[1])
+    ]
+
+
+def _calc_EndOfPrd_v_by_Risky(S, a, z, Rfree, vFunc_intermed):
+    """
+    Compute end-of-period value at values a, conditional on risky asset
+    return S and risky share z.
+    """
+    # Calculate future realizations of bank balances bNrm
+    Rxs = S - Rfree
+    Rport = Rfree + z * Rxs
+    bNrm_next = Rport * a
+
+    # Make an extended share_next of the same dimension as b_nrm so
+    # that the function can be vectorized
+    z_rep = np.broadcast_to(z, bNrm_next.shape)
+
+    EndOfPrd_v = vFunc_intermed(bNrm_next, z_rep)
+    return EndOfPrd_v
+
+
+def _calc_mNrm_next_joint(S, a, z, Rfree, PermGroFac):
+    """
+    Calculate future realizations of market resources mNrm from the shock
+    distribution S, normalized end-of-period assets a, and risky share z.
+    """
+    # Calculate future realizations of bank balances bNrm
+    Rxs = S["Risky"] - Rfree
+    Rport = Rfree + z * Rxs
+    bNrm_next = Rport * a
+    mNrm_next = bNrm_next / (S["PermShk"] * PermGroFac) + S["TranShk"]
+    return mNrm_next
+
+
+def _calc_EndOfPrd_dvdx_joint(
+    S,
+    a,
+    z,
+    Rfree,
+    PermGroFac,
+    CRRA,
+    AdjustPrb,
+    vPfuncAdj_next,
+    dvdmFuncFxd_next,
+    dvdsFuncFxd_next,
+    mNrm_next=None,
+):
+    """
+    Evaluate end-of-period marginal value of assets and risky share based
+    on the shock distribution S, values of bend of period assets a, and
+    risky share z. Realizations of mNrm_next are computed unless passed in.
+    """
+    if mNrm_next is None:
+        mNrm_next = _calc_mNrm_next_joint(S, a, z, Rfree, PermGroFac)
+    Rxs = S["Risky"] - Rfree
+    Rport = Rfree + z * Rxs
+    dvdmAdj_next = vPfuncAdj_next(mNrm_next)
+
+    # Only compute the power of the permanent shock once for each atom
+    PermGroShk = S["PermShk"] * PermGroFac
+    PermGroShkPow = PermGroShk ** (-CRRA)
+
+    if AdjustPrb < 1.0:
+        # Expand to the same dimensions as mNrm
+        Share_next_expanded = np.broadcast_to(z, mNrm_next.shape)
+        dvdmFxd_next = dvdmFuncFxd_next(mNrm_next, Share_next_expanded)
+        dvdsFxd_next = dvdsFuncFxd_next(mNrm_next, Share_next_expanded)
+        # Combine by adjustment probability; there is no marginal value of
+        # Share if it's a free choice, so only the fixed share part enters dvds
+        dvdm_next = AdjustPrb * dvdmAdj_next + (1.0 - AdjustPrb) * dvdmFxd_next
+        dvds_next = (1.0 - AdjustPrb) * dvdsFxd_next
+        dvdm_next = PermGroShkPow * dvdm_next
+        EndOfPrd_dvda = Rport * dvdm_next
+        EndOfPrd_dvds = Rxs * a * dvdm_next + PermGroShk * PermGroShkPow * dvds_next
+    else:  # Don't bother evaluating if there's no chance that portfolio share is fixed
+        dvdm_next = PermGroShkPow * dvdmAdj_next
+        EndOfPrd_dvda = Rport * dvdm_next
+        EndOfPrd_dvds = Rxs * a * dvdm_next
+
+    return EndOfPrd_dvda, EndOfPrd_dvds
+
+
+def _calc_EndOfPrd_v_joint(
+    S,
+    a,
+    z,
+    Rfree,
+    PermGroFac,
+    CRRA,
+    AdjustPrb,
+    vFuncAdj_next,
+    vFuncFxd_next,
+    vFxdTables=None,
+    mNrm_next=None,
+):
+    """
+    Evaluate end-of-period value, based on the shock distribution S, values
+    of bank balances bNrm, and values of the risky share z. If vFxdTables (from
+    _get_vFxd_tables) is given, the fixed share value is read from it rather
+    than by calling vFuncFxd_next. Realizations of mNrm_next are computed
+    unless passed in.
+    """
+    if mNrm_next is None:
+        mNrm_next = _calc_mNrm_next_joint(S, a, z, Rfree, PermGroFac)
+    vAdj_next = vFuncAdj_next(mNrm_next)
+
+    if AdjustPrb < 1.0:
+        if vFxdTables is not None:
+            vFxd_next = _eval_vFxd_tables_by_Share(mNrm_next, *vFxdTables)
+        else:
+            # Expand to the same dimensions as mNrm
+            Share_next_expanded = np.broadcast_to(z, mNrm_next.shape)
+            vFxd_next = vFuncFxd_next(mNrm_next, Share_next_expanded)
+        # Combine by adjustment probability
+        v_next = AdjustPrb * vAdj_next + (1.0 - AdjustPrb) * vFxd_next
+    else:  # Don't bother evaluating if there's no chance that portfolio share is fixed
+        v_next = vAdj_next
+
+    EndOfPrd_v = (S["PermShk"] * PermGroFac) ** (1.0 - CRRA) * v_next
+    return EndOfPrd_v
+
+
+def _calc_EndOfPrd_dvdx_v_joint(
+    S,
+    a,
+    z,
+    Rfree,
+    PermGroFac,
+    CRRA,
+    AdjustPrb,
+    vPfuncAdj_next,
+    dvdmFuncFxd_next,
+    dvdsFuncFxd_next,
+    vFuncAdj_next,
+    vFuncFxd_next,
+    vFxdTables=None,
+):
+    """
+    Evaluate end-of-period marginal value of assets and risky share and
+    end-of-period value in one pass over the shock distribution S, so that
+    realizations of mNrm_next are computed only once for all three.
+    """
+    mNrm_next = _calc_mNrm_next_joint(S, a, z, Rfree, PermGroFac)
+    EndOfPrd_dvda, EndOfPrd_dvds = _calc_EndOfPrd_dvdx_joint(
+        S,
+        a,
+        z,
+        Rfree,
+        PermGroFac,
+        CRRA,
+        AdjustPrb,
+        vPfuncAdj_next,
+        dvdmFuncFxd_next,
+        dvdsFuncFxd_next,
+        mNrm_next,
+    )
+    EndOfPrd_v = _calc_EndOfPrd_v_joint(
+        S,
+        a,
+        z,
+        Rfree,
+        PermGroFac,
+        CRRA,
+        AdjustPrb,
+        vFuncAdj_next,
+        vFuncFxd_next,
+        vFxdTables,
+        mNrm_next,
+    )
+    return EndOfPrd_dvda, EndOfPrd_dvds, EndOfPrd_v
+
 
 # Define a class to represent the single period solution of the portfolio choice problem
 class PortfolioSolution(MetricObject):
@@ -157,7 +853,7 @@ class PortfolioConsumerType(RiskyAssetConsumerType):
     """
 
     time_inv_ = deepcopy(RiskyAssetConsumerType.time_inv_)
-    time_inv_ = time_inv_ + ["AdjustPrb", "DiscreteShareBool"]
+    time_inv_ = time_inv_ + ["AdjustPrb", "DiscreteShareBool", "TableDtype"]
 
     def __init__(self, verbose=False, quiet=False, **kwds):
         params = init_portfolio.copy()
@@ -177,6 +873,172 @@ class PortfolioConsumerType(RiskyAssetConsumerType):
         self.update_ShareGrid()
         self.update_ShareLimit()
 
+    def update_income_process(self):
+        """
+        Updates this agent's income process based on his own attributes, along
+        with the attributes that are derived from it.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        RiskyAssetConsumerType.update_income_process(self)
+        self.update_BoroCnstNat_iszero()
+
+    def update_BoroCnstNat_iszero(self):
+        """
+        Creates the time-varying attribute BoroCnstNat_iszero, indicating whether
+        the natural borrowing constraint is zero in each period because the
+        smallest transitory income shock is zero. This is computed once whenever
+        the income process is updated rather than by scanning IncShkDstn in every
+        call to the solver.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        self.BoroCnstNat_iszero = [
+            np.min(self.IncShkDstn[t].atoms[1]) == 0.0 for t in range(self.T_cycle)
+        ]
+        self.add_to_time_vary("BoroCnstNat_iszero")
+        self._EndOfPrdGrids_stale = True
+
+    def update_assets_grid(self):
+        """
+        Updates this agent's end-of-period assets grid by constructing a multi-
+        exponentially spaced grid of aXtra values, and marks the grids derived
+        from it to be rebuilt.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        RiskyAssetConsumerType.update_assets_grid(self)
+        self._EndOfPrdGrids_stale = True
+
+    def update_RiskyDstn(self):
+        """
+        Creates the attribute RiskyDstn from the primitive attributes RiskyAvg,
+        RiskyStd, and RiskyCount, along with the bounds on risky returns that are
+        derived from it.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        RiskyAssetConsumerType.update_RiskyDstn(self)
+        self.update_RiskyBounds()
+
+    def update_RiskyBounds(self):
+        """
+        Creates the attributes RiskyMax and RiskyMin, the largest and smallest
+        risky returns in each period, which bound the grid of bank balances used
+        by the solver. They are time-varying if RiskyDstn is. The distribution
+        they were found from is kept, so that pre_solve can find them again if
+        RiskyDstn has been replaced since.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        if "RiskyDstn" in self.time_vary:
+            RiskyDstns = [self.RiskyDstn[t] for t in range(self.T_cycle)]
+            self.RiskyMax = [np.max(dstn.atoms) for dstn in RiskyDstns]
+            self.RiskyMin = [np.min(dstn.atoms) for dstn in RiskyDstns]
+            self.del_from_time_inv("RiskyMax", "RiskyMin")
+            self.add_to_time_vary("RiskyMax", "RiskyMin")
+        else:
+            self.RiskyMax = np.max(self.RiskyDstn.atoms)
+            self.RiskyMin = np.min(self.RiskyDstn.atoms)
+            self.del_from_time_vary("RiskyMax", "RiskyMin")
+            self.add_to_time_inv("RiskyMax", "RiskyMin")
+        self._RiskyBoundsDstn = self.RiskyDstn
+        self._EndOfPrdGrids_stale = True
+
+    def update_EndOfPrdGrids(self):
+        """
+        Creates the time-varying attributes aNrmGrid and bNrmGrid, the grids of
+        end-of-period assets and of bank balances (assets times the return factor)
+        used by the solver in each period. Periods that share the same borrowing
+        constraint and bounds on risky returns share the same arrays, so the grids
+        are only constructed once for most lifecycle calibrations. This is called
+        by pre_solve whenever aXtraGrid, BoroCnstNat_iszero, or the bounds on risky
+        returns have been updated since the grids were last built.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        None
+        """
+        grid_cache = {}
+        self.aNrmGrid = []
+        self.bNrmGrid = []
+        for t in range(self.T_cycle):
+            if "RiskyMax" in self.time_vary:
+                RiskyMax = self.RiskyMax[t]
+                RiskyMin = self.RiskyMin[t]
+            else:
+                RiskyMax = self.RiskyMax
+                RiskyMin = self.RiskyMin
+            BoroCnstNat_iszero = self.BoroCnstNat_iszero[t]
+
+            key = (BoroCnstNat_iszero, RiskyMax, RiskyMin)
+            if key not in grid_cache:
+                # bNrm represents R*a, balances after asset return shocks but before
+                # income. This just uses the highest risky return as a rough shifter
+                # for the aXtraGrid.
+                bNrmGrid = np.empty(self.aXtraGrid.size + 1)
+                if BoroCnstNat_iszero:
+                    aNrmGrid = self.aXtraGrid
+                    bNrmGrid[0] = RiskyMin * self.aXtraGrid[0]
+                    np.multiply(RiskyMax, self.aXtraGrid, out=bNrmGrid[1:])
+                else:
+                    # Add an asset point at exactly zero
+                    aNrmGrid = np.empty(self.aXtraGrid.size + 1)
+                    aNrmGrid[0] = 0.0
+                    aNrmGrid[1:] = self.aXtraGrid
+                    np.multiply(RiskyMax, aNrmGrid, out=bNrmGrid)
+                grid_cache[key] = (aNrmGrid, bNrmGrid)
+
+            self.aNrmGrid.append(grid_cache[key][0])
+            self.bNrmGrid.append(grid_cache[key][1])
+        self.add_to_time_vary("aNrmGrid", "bNrmGrid")
+        self._EndOfPrdGrids_stale = False
+
+    def pre_solve(self):
+        RiskyAssetConsumerType.pre_solve(self)
+
+        # Find the bounds on risky returns again if RiskyDstn was replaced directly
+        if self.RiskyDstn is not getattr(self, "_RiskyBoundsDstn", None):
+            self.update_RiskyBounds()
+
+        # Rebuild the end-of-period grids if any of their inputs were updated
+        if getattr(self, "_EndOfPrdGrids_stale", True):
+            self.update_EndOfPrdGrids()
+
     def update_solution_terminal(self):
         """
         Solves the terminal period of the portfolio choice problem.  The solution is
@@ -239,8 +1101,13 @@ class PortfolioConsumerType(RiskyAssetConsumerType):
         None
         """
         # these need to be set because "post states",
-        # but are a control variable and shock, respectively
-        self.controls["Share"] = np.zeros(self.AgentCount)
+        # but are a control variable and shock, respectively;
+        # reuse the existing array when re-initializing the same population
+        Share = self.controls.get("Share")
+        if isinstance(Share, np.ndarray) and Share.shape == (self.AgentCount,):
+            Share.fill(0.0)
+        else:
+            self.controls["Share"] = np.zeros(self.AgentCount)
         RiskyAssetConsumerType.initialize_sim(self)
 
     def sim_birth(self, which_agents):
@@ -259,9 +1126,52 @@ class PortfolioConsumerType(RiskyAssetConsumerType):
         """
         IndShockConsumerType.sim_birth(self, which_agents)
 
-        self.controls["Share"][which_agents] = 0
+        # Nothing more to do if no agents are being born this period
+        if not np.any(which_agents):
+            return
+
+        np.putmask(self.controls["Share"], which_agents, 0.0)
         # here a shock is being used as a 'post state'
-        self.shocks["Adjust"][which_agents] = False
+        np.putmask(self.shocks["Adjust"], which_agents, False)
+
+    def get_AdjTables(self):
+        """
+        Gathers the consumption and risky share functions for agents who can adjust
+        their portfolio into tables with one row per period of the cycle (see
+        _make_LinearInterp_table), so that get_controls can evaluate them for all
+        agents in one call. The tables are rebuilt only when the solution changes.
+
+        Parameters
+        ----------
+        None
+
+        Returns
+        -------
+        AdjTables : (tuple, tuple) or None
+            Tables for cFuncAdj and ShareFuncAdj, or None if those are not all
+            LinearInterp objects.
+        """
+        funcs = [self.solution[t].cFuncAdj for t in range(self.T_cycle)] + [
+            self.solution[t].ShareFuncAdj for t in range(self.T_cycle)
+        ]
+        if not all(type(f) is LinearInterp for f in funcs):
+            return None
+
+        cached = getattr(self, "_AdjTables", None)
+        if (
+            cached is None
+            or len(cached[0]) != len(funcs)
+            or any(f is not g for f, g in zip(funcs, cached[0]))
+        ):
+            cached = (
+                funcs,
+                (
+                    _make_LinearInterp_table(funcs[: self.T_cycle]),
+                    _make_LinearInterp_table(funcs[self.T_cycle :]),
+                ),
+            )
+            self._AdjTables = cached
+        return cached[1]
 
     def get_controls(self):
         """
@@ -278,26 +1188,66 @@ class PortfolioConsumerType(RiskyAssetConsumerType):
         """
         cNrmNow = np.zeros(self.AgentCount) + np.nan
         ShareNow = np.zeros(self.AgentCount) + np.nan
-
-        # Loop over each period of the cycle, getting controls separately depending on "age"
+        mNrmNow = self.state_now["mNrm"]
+        SharePrev = self.controls["Share"]
+
+        # Sort agents by "age" and then by whether they can adjust their portfolio
+        # share, so that each group of agents is a contiguous block of the ordering
+        Adjust = self.shocks["Adjust"].astype(bool)
+        order = np.lexsort((Adjust, self.t_cycle))
+        t_bounds = np.searchsorted(self.t_cycle[order], np.arange(self.T_cycle + 1))
+        Adjust_sorted = Adjust[order]
+
+        # If the policy functions of agents who can adjust are linear interpolants
+        # in every period, evaluate them for all of those agents at once
+        AdjTables = self.get_AdjTables()
+        if AdjTables is not None:
+            adj = np.flatnonzero(Adjust)
+            if adj.size > 0:
+                t_adj = self.t_cycle[adj]
+                mNrm = mNrmNow[adj]
+                cNrmNow[adj] = _eval_LinearInterp_table(*AdjTables[0], t_adj, mNrm)
+                ShareNow[adj] = _eval_LinearInterp_table(*AdjTables[1], t_adj, mNrm)
+            no_one = np.zeros(0, dtype=order.dtype)
+
+        # Find the agents who can and can't adjust in each period of the cycle
+        tasks = []
         for t in range(self.T_cycle):
-            these = t == self.t_cycle
+            bot, top = t_bounds[t], t_bounds[t + 1]
+            if bot == top:
+                continue
+            # Agents who can't adjust come before those who can within the block
+            mid = bot + np.searchsorted(Adjust_sorted[bot:top], True)
+            adj = order[mid:top] if AdjTables is None else no_one
+            tasks.append((t, adj, order[bot:mid]))
 
-            # Get controls for agents who *can* adjust their portfolio share
-            those = np.logical_and(these, self.shocks["Adjust"])
-            cNrmNow[those] = self.solution[t].cFuncAdj(self.state_now["mNrm"][those])
-            ShareNow[those] = self.solution[t].ShareFuncAdj(
-                self.state_now["mNrm"][those]
-            )
+        def get_controls_for_period(task):
+            t, adj, fxd = task
 
-            # Get Controls for agents who *can't* adjust their portfolio share
-            those = np.logical_and(these, np.logical_not(self.shocks["Adjust"]))
-            cNrmNow[those] = self.solution[t].cFuncFxd(
-                self.state_now["mNrm"][those], ShareNow[those]
-            )
-            ShareNow[those] = self.solution[t].ShareFuncFxd(
-                self.state_now["mNrm"][those], ShareNow[those]
-            )
+            # Get controls for agents who *can* adjust their portfolio share
+            if adj.size > 0:
+                mNrm = mNrmNow[adj]
+                cNrmNow[adj] = self.solution[t].cFuncAdj(mNrm)
+                ShareNow[adj] = self.solution[t].ShareFuncAdj(mNrm)
+
+            # Get controls for agents who *can't* adjust their portfolio share,
+            # who keep the share they had at the end of last period
+            if fxd.size > 0:
+                mNrm = mNrmNow[fxd]
+                Share = SharePrev[fxd]
+                cNrmNow[fxd] = self.solution[t].cFuncFxd(mNrm, Share)
+                ShareNow[fxd] = self.solution[t].ShareFuncFxd(mNrm, Share)
+
+        # Periods select disjoint sets of agents, so with a large population they
+        # can be handled in parallel threads; the interpolators spend most of their
+        # time in numpy routines that release the GIL
+        if len(tasks) > 1 and self.AgentCount >= _THREADED_CONTROLS_MIN_AGENTS:
+            max_workers = min(os.cpu_count() or 1, len(tasks))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                list(executor.map(get_controls_for_period, tasks))
+        else:
+            for task in tasks:
+                get_controls_for_period(task)
 
         # Store controls as attributes of self
         self.controls["cNrm"] = cNrmNow
@@ -322,6 +1272,10 @@ def solve_one_period_ConsPortfolio(
     vFuncBool,
     DiscreteShareBool,
     IndepDstnBool,
+    BoroCnstNat_iszero,
+    aNrmGrid,
+    bNrmGrid,
+    TableDtype,
 ):
     """
     Solve one period of a consumption-saving problem with portfolio allocation
@@ -383,6 +1337,21 @@ def solve_one_period_ConsPortfolio(
     IndepDstnBool : bool
         Indicator for whether the income and risky return distributions are in-
         dependent of each other, which can speed up the expectations step.
+    BoroCnstNat_iszero : bool
+        Indicator for whether the natural borrowing constraint is zero, which
+        is the case when the smallest transitory income shock is zero.
+    aNrmGrid : np.array
+        Grid of end-of-period normalized assets: aXtraGrid, with a point at zero
+        added unless the natural borrowing constraint is zero.
+    bNrmGrid : np.array
+        Grid of normalized bank balances (assets after risky returns are realized
+        but before income), spanning aNrmGrid shifted by the extreme risky returns.
+    TableDtype : type
+        Floating point type used to store the intermediate marginal value tables
+        that are interpolated when integrating over risky returns, if income and
+        return distributions are independent. Expectations are still accumulated
+        in float64; float32 halves the memory traffic of the tables at the cost of
+        precision, which can keep tight solution tolerances from being reached.
 
     Returns
     -------
@@ -412,10 +1381,6 @@ def solve_one_period_ConsPortfolio(
     vFuncAdj_next = solution_next.vFuncAdj
     vFuncFxd_next = solution_next.vFuncFxd
 
-    # Set a flag for whether the natural borrowing constraint is zero, which
-    # depends on whether the smallest transitory income shock is zero
-    BoroCnstNat_iszero = np.min(IncShkDstn.atoms[1]) == 0.0
-
     # Prepare to calculate end-of-period marginal values by creating an array
     # of market resources that the agent could have next period, considering
     # the grid of end-of-period assets and the distribution of shocks he might
@@ -423,32 +1388,26 @@ def solve_one_period_ConsPortfolio(
 
     # Unpack the risky return shock distribution
     Risky_next = RiskyDstn.atoms
-    RiskyMax = np.max(Risky_next)
-    RiskyMin = np.min(Risky_next)
 
     # Perform an alternate calculation of the absolute patience factor when
     # returns are risky. This uses the Merton-Samuelson limiting risky share,
     # which is what's relevant as mNrm goes to infinity.
-    def calc_Radj(R):
-        Rport = ShareLimit * R + (1.0 - ShareLimit) * Rfree
-        return Rport ** (1.0 - CRRA)
-
-    R_adj = expected(calc_Radj, RiskyDstn)[0]
+    Rport_lim = ShareLimit * Risky_next[0] + (1.0 - ShareLimit) * Rfree
+    R_adj = np.dot(RiskyDstn.pmv, Rport_lim ** (1.0 - CRRA))
     PatFac = (DiscFacEff * R_adj) ** (1.0 / CRRA)
     MPCminNow = 1.0 / (1.0 + PatFac / solution_next.MPCmin)
 
-    # Also perform an alternate calculation for human wealth under risky returns
-    def calc_hNrm(S):
-        Risky = S["Risky"]
-        PermShk = S["PermShk"]
-        TranShk = S["TranShk"]
-        G = PermGroFac * PermShk
-        Rport = ShareLimit * Risky + (1.0 - ShareLimit) * Rfree
-        hNrm = (G / Rport**CRRA) * (TranShk + solution_next.hNrm)
-        return hNrm
-
-    # This correctly accounts for risky returns and risk aversion
-    hNrmNow = expected(calc_hNrm, ShockDstn) / R_adj
+    # Also perform an alternate calculation for human wealth under risky returns.
+    # This correctly accounts for risky returns and risk aversion. The shocks are
+    # looked up by name, as their order in ShockDstn follows IncShkDstn
+    PermShk_joint = ShockDstn.variables["PermShk"].values
+    TranShk_joint = ShockDstn.variables["TranShk"].values
+    Risky_joint = ShockDstn.variables["Risky"].values
+    Rport_lim_joint = ShareLimit * Risky_joint + (1.0 - ShareLimit) * Rfree
+    hNrm_by_shk = (PermGroFac * PermShk_joint / Rport_lim_joint**CRRA) * (
+        TranShk_joint + solution_next.hNrm
+    )
+    hNrmNow = np.dot(ShockDstn.pmv, hNrm_by_shk) / R_adj
 
     # This basic equation works if there's no correlation among shocks
     # hNrmNow = (PermGroFac/Rfree)*(1 + solution_next.hNrm)
@@ -457,16 +1416,6 @@ def solve_one_period_ConsPortfolio(
     cFuncLimitIntercept = MPCminNow * hNrmNow
     cFuncLimitSlope = MPCminNow
 
-    # bNrm represents R*a, balances after asset return shocks but before income.
-    # This just uses the highest risky return as a rough shifter for the aXtraGrid.
-    if BoroCnstNat_iszero:
-        aNrmGrid = aXtraGrid
-        bNrmGrid = np.insert(RiskyMax * aXtraGrid, 0, RiskyMin * aXtraGrid[0])
-    else:
-        # Add an asset point at exactly zero
-        aNrmGrid = np.insert(aXtraGrid, 0, 0.0)
-        bNrmGrid = RiskyMax * np.insert(aXtraGrid, 0, 0.0)
-
     # Get grid and shock sizes, for easier indexing
     aNrmCount = aNrmGrid.size
     ShareCount = ShareGrid.size
@@ -477,180 +1426,130 @@ def solve_one_period_ConsPortfolio(
     # shocks, *then* compute end-of-period expectations by integrating out return shocks.
     # This method is lengthy to code, but can be significantly faster.
     if IndepDstnBool:
-        # Make tiled arrays to calculate future realizations of mNrm and Share when integrating over IncShkDstn
-        bNrmNext, ShareNext = np.meshgrid(bNrmGrid, ShareGrid, indexing="ij")
-
-        # Define functions that are used internally to evaluate future realizations
-        def calc_mNrm_next(S, b):
-            """
-            Calculate future realizations of market resources mNrm from the income
-            shock distribution S and normalized bank balances b.
-            """
-            return b / (S["PermShk"] * PermGroFac) + S["TranShk"]
-
-        def calc_dvdm_next(S, b, z):
-            """
-            Evaluate realizations of marginal value of market resources next period,
-            based on the income distribution S, values of bank balances bNrm, and
-            values of the risky share z.
-            """
-            mNrm_next = calc_mNrm_next(S, b)
-            dvdmAdj_next = vPfuncAdj_next(mNrm_next)
-
-            if AdjustPrb < 1.0:
-                # Expand to the same dimensions as mNrm
-                Share_next_expanded = z + np.zeros_like(mNrm_next)
-                dvdmFxd_next = dvdmFuncFxd_next(mNrm_next, Share_next_expanded)
-                # Combine by adjustment probability
-                dvdm_next = AdjustPrb * dvdmAdj_next + (1.0 - AdjustPrb) * dvdmFxd_next
-            else:  # Don't bother evaluating if there's no chance that portfolio share is fixed
-                dvdm_next = dvdmAdj_next
-
-            dvdm_next = (S["PermShk"] * PermGroFac) ** (-CRRA) * dvdm_next
-            return dvdm_next
-
-        def calc_dvds_next(S, b, z):
-            """
-            Evaluate realizations of marginal value of risky share next period, based
-            on the income distribution S, values of bank balances bNrm, and values of
-            the risky share z.
-            """
-            mNrm_next = calc_mNrm_next(S, b)
-
-            # No marginal value of Share if it's a free choice!
-            dvdsAdj_next = np.zeros_like(mNrm_next)
-
-            if AdjustPrb < 1.0:
-                # Expand to the same dimensions as mNrm
-                Share_next_expanded = z + np.zeros_like(mNrm_next)
-                dvdsFxd_next = dvdsFuncFxd_next(mNrm_next, Share_next_expanded)
-                # Combine by adjustment probability
-                dvds_next = AdjustPrb * dvdsAdj_next + (1.0 - AdjustPrb) * dvdsFxd_next
-            else:  # Don't bother evaluating if there's no chance that portfolio share is fixed
-                dvds_next = dvdsAdj_next
+        # Unpack the income shock distribution
+        ShkPrbsNext = IncShkDstn.pmv
+        PermShkValsNext = IncShkDstn.variables["PermShk"].values
+        TranShkValsNext = IncShkDstn.variables["TranShk"].values
+        IncShkCount = ShkPrbsNext.size
+        bNrmCount = bNrmGrid.size
+
+        # Calculate future realizations of market resources on the grid of bNrm;
+        # these do not depend on the risky share, which only matters when the
+        # agent can't adjust their portfolio next period
+        mNrm_next_by_b = _calc_mNrm_next(
+            bNrmGrid, PermShkValsNext, TranShkValsNext, PermGroFac
+        )
+        if AdjustPrb < 1.0:
+            # Expand to the dimensions of (bNrm, Share, IncShk) for the fixed share functions
+            mNrm_next_by_bz = np.broadcast_to(
+                mNrm_next_by_b[:, np.newaxis, :], (bNrmCount, ShareCount, IncShkCount)
+            )
+            Share_next_by_bz = np.broadcast_to(
+                ShareGrid[np.newaxis, :, np.newaxis], mNrm_next_by_bz.shape
+            )
 
-            dvds_next = (S["PermShk"] * PermGroFac) ** (1.0 - CRRA) * dvds_next
-            return dvds_next
+        # Fold the (PermShk*PermGroFac)**(-CRRA) and **(1-CRRA) scaling factors into
+        # the probability weights, so that each power is computed once per atom
+        PermGroShkNext = PermShkValsNext * PermGroFac
+        IncShkWeights_dvdm = ShkPrbsNext * PermGroShkNext ** (-CRRA)
+        IncShkWeights_v = IncShkWeights_dvdm * PermGroShkNext
 
         # Calculate end-of-period marginal value of assets and shares at each point
         # in aNrm and ShareGrid. Does so by taking expectation of next period marginal
         # values across income and risky return shocks.
 
+        # Calculate the expectations over income shocks of marginal value of bank
+        # balances and of risky share for agents who can't adjust, in one pass
+        # over next period's gridpoints if possible
+        if AdjustPrb < 1.0:
+            FxdTables = _get_Fxd_tables(solution_next, ShareGrid)
+            if FxdTables is not None:
+                dvdmFxd_intermed, dvdsFxd_intermed = _calc_exp_Fxd_by_bz(
+                    mNrm_next_by_b,
+                    *FxdTables,
+                    IncShkWeights_dvdm,
+                    IncShkWeights_v,
+                )
+            else:
+                dvdmFxd_next = dvdmFuncFxd_next(mNrm_next_by_bz, Share_next_by_bz)
+                dvdsFxd_next = dvdsFuncFxd_next(mNrm_next_by_bz, Share_next_by_bz)
+                dvdmFxd_intermed = np.dot(dvdmFxd_next, IncShkWeights_dvdm)
+                dvdsFxd_intermed = np.dot(dvdsFxd_next, IncShkWeights_v)
+        else:  # Don't bother evaluating if there's no chance that portfolio share is fixed
+            dvdmFxd_intermed = None
+
         # Calculate intermediate marginal value of bank balances by taking expectations over income shocks
-        dvdb_intermed = expected(calc_dvdm_next, IncShkDstn, args=(bNrmNext, ShareNext))
-        dvdbNvrs_intermed = uFunc.derinv(dvdb_intermed, order=(1, 0))
-        dvdbNvrsFunc_intermed = BilinearInterp(dvdbNvrs_intermed, bNrmGrid, ShareGrid)
-        dvdbFunc_intermed = MargValueFuncCRRA(dvdbNvrsFunc_intermed, CRRA)
+        dvdmAdj_next = vPfuncAdj_next(mNrm_next_by_b)
+        dvdb_intermed = _calc_exp_by_bz(
+            dvdmAdj_next, dvdmFxd_intermed, IncShkWeights_dvdm, AdjustPrb, ShareCount
+        )
+        dvdbNvrs_intermed = _CRRAutilityP_inv_inplace(dvdb_intermed, CRRA)
 
         # Calculate intermediate marginal value of risky portfolio share by taking expectations over income shocks
-        dvds_intermed = expected(calc_dvds_next, IncShkDstn, args=(bNrmNext, ShareNext))
-        dvdsFunc_intermed = BilinearInterp(dvds_intermed, bNrmGrid, ShareGrid)
-
-        # Make tiled arrays to calculate future realizations of bNrm and Share when integrating over RiskyDstn
-        aNrmNow, ShareNext = np.meshgrid(aNrmGrid, ShareGrid, indexing="ij")
-
-        # Define functions for calculating end-of-period marginal value
-        def calc_EndOfPrd_dvda(S, a, z):
-            """
-            Compute end-of-period marginal value of assets at values a, conditional
-            on risky asset return S and risky share z.
-            """
-            # Calculate future realizations of bank balances bNrm
-            Rxs = S - Rfree  # Excess returns
-            Rport = Rfree + z * Rxs  # Portfolio return
-            bNrm_next = Rport * a
-
-            # Ensure shape concordance
-            z_rep = z + np.zeros_like(bNrm_next)
-
-            # Calculate and return dvda
-            EndOfPrd_dvda = Rport * dvdbFunc_intermed(bNrm_next, z_rep)
-            return EndOfPrd_dvda
-
-        def calc_EndOfPrddvds(S, a, z):
-            """
-            Compute end-of-period marginal value of risky share at values a, conditional
-            on risky asset return S and risky share z.
-            """
-            # Calculate future realizations of bank balances bNrm
-            Rxs = S - Rfree  # Excess returns
-            Rport = Rfree + z * Rxs  # Portfolio return
-            bNrm_next = Rport * a
-
-            # Make the shares match the dimension of b, so that it can be vectorized
-            z_rep = z + np.zeros_like(bNrm_next)
-
-            # Calculate and return dvds
-            EndOfPrd_dvds = Rxs * a * dvdbFunc_intermed(
-                bNrm_next, z_rep
-            ) + dvdsFunc_intermed(bNrm_next, z_rep)
-            return EndOfPrd_dvds
-
-        # Evaluate realizations of value and marginal value after asset returns are realized
-
-        # Calculate end-of-period marginal value of assets by taking expectations
-        EndOfPrd_dvda = DiscFacEff * expected(
-            calc_EndOfPrd_dvda, RiskyDstn, args=(aNrmNow, ShareNext)
+        if AdjustPrb < 1.0:
+            dvds_intermed = (1.0 - AdjustPrb) * dvdsFxd_intermed
+        else:  # No marginal value of Share if it's a free choice!
+            dvds_intermed = np.zeros((bNrmCount, ShareCount))
+
+        # Calculate end-of-period marginal value of assets and risky portfolio share
+        # by taking expectations over risky returns, interpolating the intermediate
+        # marginal values (which are on the same ShareGrid) along bNrmGrid
+        EndOfPrd_dvda, EndOfPrd_dvds = _calc_EndOfPrd_dvdx_by_Risky(
+            aNrmGrid,
+            ShareGrid,
+            RiskyDstn.atoms[0],
+            RiskyDstn.pmv,
+            Rfree,
+            CRRA,
+            bNrmGrid,
+            np.ascontiguousarray(dvdbNvrs_intermed.T, dtype=TableDtype),
+            np.ascontiguousarray(dvds_intermed.T, dtype=TableDtype),
         )
+        EndOfPrd_dvda *= DiscFacEff
+        EndOfPrd_dvds *= DiscFacEff
         EndOfPrd_dvdaNvrs = uFunc.derinv(EndOfPrd_dvda)
 
-        # Calculate end-of-period marginal value of risky portfolio share by taking expectations
-        EndOfPrd_dvds = DiscFacEff * expected(
-            calc_EndOfPrddvds, RiskyDstn, args=(aNrmNow, ShareNext)
-        )
-
         # Make the end-of-period value function if the value function is requested
         if vFuncBool:
-
-            def calc_v_intermed(S, b, z):
-                """
-                Calculate "intermediate" value from next period's bank balances, the
-                income shocks S, and the risky asset share.
-                """
-                mNrm_next = calc_mNrm_next(S, b)
-
-                vAdj_next = vFuncAdj_next(mNrm_next)
-                if AdjustPrb < 1.0:
-                    vFxd_next = vFuncFxd_next(mNrm_next, z)
-                    # Combine by adjustment probability
-                    v_next = AdjustPrb * vAdj_next + (1.0 - AdjustPrb) * vFxd_next
-                else:  # Don't bother evaluating if there's no chance that portfolio share is fixed
-                    v_next = vAdj_next
-
-                v_intermed = (S["PermShk"] * PermGroFac) ** (1.0 - CRRA) * v_next
-                return v_intermed
-
             # Calculate intermediate value by taking expectations over income shocks
-            v_intermed = expected(
-                calc_v_intermed, IncShkDstn, args=(bNrmNext, ShareNext)
+            vAdj_next = vFuncAdj_next(mNrm_next_by_b)
+            if AdjustPrb < 1.0:
+                vFxdTables = _get_vFxd_tables(solution_next, ShareGrid)
+                if vFxdTables is not None:
+                    vFxd_intermed = _calc_exp_vFxd_by_bz(
+                        mNrm_next_by_b, *vFxdTables, IncShkWeights_v
+                    )
+                else:
+                    vFxd_next = vFuncFxd_next(mNrm_next_by_bz, Share_next_by_bz)
+                    vFxd_intermed = np.dot(vFxd_next, IncShkWeights_v)
+            else:  # Don't bother evaluating if there's no chance that portfolio share is fixed
+                vFxd_intermed = None
+            v_intermed = _calc_exp_by_bz(
+                vAdj_next, vFxd_intermed, IncShkWeights_v, AdjustPrb, ShareCount
             )
 
             # Construct the "intermediate value function" for this period
-            vNvrs_intermed = uFunc.inv(v_intermed)
-            vNvrsFunc_intermed = BilinearInterp(vNvrs_intermed, bNrmGrid, ShareGrid)
+            # The value table is kept in float64, which econforge's interpolator
+            # requires
+            vNvrs_intermed = _CRRAutility_inv_inplace(v_intermed, CRRA)
+            vNvrsFunc_intermed = LinearFast(vNvrs_intermed, [bNrmGrid, ShareGrid])
             vFunc_intermed = ValueFuncCRRA(vNvrsFunc_intermed, CRRA)
 
-            def calc_EndOfPrd_v(S, a, z):
-                # Calculate future realizations of bank balances bNrm
-                Rxs = S - Rfree
-                Rport = Rfree + z * Rxs
-                bNrm_next = Rport * a
-
-                # Make an extended share_next of the same dimension as b_nrm so
-                # that the function can be vectorized
-                z_rep = z + np.zeros_like(bNrm_next)
-
-                EndOfPrd_v = vFunc_intermed(bNrm_next, z_rep)
-                return EndOfPrd_v
+            # Make broadcastable arrays to calculate future realizations of bNrm and Share when integrating over RiskyDstn
+            aNrmNow = aNrmGrid[:, np.newaxis]
+            ShareNext = ShareGrid[np.newaxis, :]
 
             # Calculate end-of-period value by taking expectations
-            EndOfPrd_v = DiscFacEff * expected(
-                calc_EndOfPrd_v, RiskyDstn, args=(aNrmNow, ShareNext)
+            EndOfPrd_v = expected(
+                _calc_EndOfPrd_v_by_Risky,
+                RiskyDstn,
+                args=(aNrmNow, ShareNext, Rfree, vFunc_intermed),
             )
+            EndOfPrd_v *= DiscFacEff
             EndOfPrd_vNvrs = uFunc.inv(EndOfPrd_v)
 
             # Now make an end-of-period value function over aNrm and Share
-            EndOfPrd_vNvrsFunc = BilinearInterp(EndOfPrd_vNvrs, aNrmGrid, ShareGrid)
+            EndOfPrd_vNvrsFunc = LinearFast(EndOfPrd_vNvrs, [aNrmGrid, ShareGrid])
             EndOfPrd_vFunc = ValueFuncCRRA(EndOfPrd_vNvrsFunc, CRRA)
             # This will be used later to make the value function for this period
 
@@ -658,106 +1557,114 @@ def solve_one_period_ConsPortfolio(
     # independent, then computation of end-of-period expectations are simpler in
     # code, but might take longer to execute
     else:
-        # Make tiled arrays to calculate future realizations of mNrm and Share when integrating over IncShkDstn
-        aNrmNow, ShareNext = np.meshgrid(aNrmGrid, ShareGrid, indexing="ij")
-
-        # Define functions that are used internally to evaluate future realizations
-        def calc_mNrm_next(S, a, z):
-            """
-            Calculate future realizations of market resources mNrm from the shock
-            distribution S, normalized end-of-period assets a, and risky share z.
-            """
-            # Calculate future realizations of bank balances bNrm
-            Rxs = S["Risky"] - Rfree
-            Rport = Rfree + z * Rxs
-            bNrm_next = Rport * a
-            mNrm_next = bNrm_next / (S["PermShk"] * PermGroFac) + S["TranShk"]
-            return mNrm_next
-
-        def calc_EndOfPrd_dvdx(S, a, z):
-            """
-            Evaluate end-of-period marginal value of assets and risky share based
-            on the shock distribution S, values of bend of period assets a, and
-            risky share z.
-            """
-            mNrm_next = calc_mNrm_next(S, a, z)
-            Rxs = S["Risky"] - Rfree
-            Rport = Rfree + z * Rxs
-            dvdmAdj_next = vPfuncAdj_next(mNrm_next)
-            # No marginal value of Share if it's a free choice!
-            dvdsAdj_next = np.zeros_like(mNrm_next)
-
-            if AdjustPrb < 1.0:
-                # Expand to the same dimensions as mNrm
-                Share_next_expanded = z + np.zeros_like(mNrm_next)
-                dvdmFxd_next = dvdmFuncFxd_next(mNrm_next, Share_next_expanded)
-                dvdsFxd_next = dvdsFuncFxd_next(mNrm_next, Share_next_expanded)
-                # Combine by adjustment probability
-                dvdm_next = AdjustPrb * dvdmAdj_next + (1.0 - AdjustPrb) * dvdmFxd_next
-                dvds_next = AdjustPrb * dvdsAdj_next + (1.0 - AdjustPrb) * dvdsFxd_next
-            else:  # Don't bother evaluating if there's no chance that portfolio share is fixed
-                dvdm_next = dvdmAdj_next
-                dvds_next = dvdsAdj_next
-
-            EndOfPrd_dvda = Rport * (S["PermShk"] * PermGroFac) ** (-CRRA) * dvdm_next
-            EndOfPrd_dvds = (
-                Rxs * a * (S["PermShk"] * PermGroFac) ** (-CRRA) * dvdm_next
-                + (S["PermShk"] * PermGroFac) ** (1 - CRRA) * dvds_next
-            )
-
-            return EndOfPrd_dvda, EndOfPrd_dvds
-
-        def calc_EndOfPrd_v(S, a, z):
-            """
-            Evaluate end-of-period value, based on the shock distribution S, values
-            of bank balances bNrm, and values of the risky share z.
-            """
-            mNrm_next = calc_mNrm_next(S, a, z)
-            vAdj_next = vFuncAdj_next(mNrm_next)
-
-            if AdjustPrb < 1.0:
-                # Expand to the same dimensions as mNrm
-                Share_next_expanded = z + np.zeros_like(mNrm_next)
-                vFxd_next = vFuncFxd_next(mNrm_next, Share_next_expanded)
-                # Combine by adjustment probability
-                v_next = AdjustPrb * vAdj_next + (1.0 - AdjustPrb) * vFxd_next
-            else:  # Don't bother evaluating if there's no chance that portfolio share is fixed
-                v_next = vAdj_next
-
-            EndOfPrd_v = (S["PermShk"] * PermGroFac) ** (1.0 - CRRA) * v_next
-            return EndOfPrd_v
+        # Make broadcastable arrays to calculate future realizations of mNrm and Share when integrating over ShockDstn
+        aNrmNow = aNrmGrid[:, np.newaxis]
+        ShareNext = ShareGrid[np.newaxis, :]
+
+        # Read next period's consumption and fixed share marginal value functions'
+        # gridpoints if possible, so that the marginal values can be interpolated
+        # inside a single kernel over aNrm, Share and the shock atoms
+        AdjTable = _get_Adj_table(solution_next)
+        FxdTables = None
+        if AdjTable is not None:
+            FxdTables = _get_Fxd_tables(solution_next, ShareGrid)
+        if AdjustPrb < 1.0:
+            vFxdTables = _get_vFxd_tables(solution_next, ShareGrid)
+        else:
+            vFxdTables = None
 
         # Evaluate realizations of value and marginal value after asset returns are realized
 
-        # Calculate end-of-period marginal value of assets and risky share by taking expectations
-        EndOfPrd_dvda, EndOfPrd_dvds = DiscFacEff * expected(
-            calc_EndOfPrd_dvdx, ShockDstn, args=(aNrmNow, ShareNext)
-        )
-        EndOfPrd_dvdaNvrs = uFunc.derinv(EndOfPrd_dvda)
+        # Calculate end-of-period marginal value of assets and risky share by taking
+        # expectations. Without the tables, end-of-period value is computed in the
+        # same pass when requested, so that mNrm_next is only built once
+        if AdjTable is not None and FxdTables is not None:
+            EndOfPrd_dvda, EndOfPrd_dvds = _calc_EndOfPrd_dvdx_joint_tab(
+                aNrmGrid,
+                ShareGrid,
+                PermShk_joint,
+                TranShk_joint,
+                Risky_joint,
+                ShockDstn.pmv,
+                Rfree,
+                PermGroFac,
+                CRRA,
+                AdjustPrb,
+                *AdjTable,
+                *FxdTables,
+            )
+            EndOfPrd_dvda *= DiscFacEff
+            EndOfPrd_dvds *= DiscFacEff
+            if vFuncBool:
+                EndOfPrd_v = DiscFacEff * expected(
+                    _calc_EndOfPrd_v_joint,
+                    ShockDstn,
+                    args=(
+                        aNrmNow,
+                        ShareNext,
+                        Rfree,
+                        PermGroFac,
+                        CRRA,
+                        AdjustPrb,
+                        vFuncAdj_next,
+                        vFuncFxd_next,
+                        vFxdTables,
+                    ),
+                )
+        elif vFuncBool:
+            EndOfPrd_dvda, EndOfPrd_dvds, EndOfPrd_v = DiscFacEff * expected(
+                _calc_EndOfPrd_dvdx_v_joint,
+                ShockDstn,
+                args=(
+                    aNrmNow,
+                    ShareNext,
+                    Rfree,
+                    PermGroFac,
+                    CRRA,
+                    AdjustPrb,
+                    vPfuncAdj_next,
+                    dvdmFuncFxd_next,
+                    dvdsFuncFxd_next,
+                    vFuncAdj_next,
+                    vFuncFxd_next,
+                    vFxdTables,
+                ),
+            )
+        else:
+            EndOfPrd_dvda, EndOfPrd_dvds = DiscFacEff * expected(
+                _calc_EndOfPrd_dvdx_joint,
+                ShockDstn,
+                args=(
+                    aNrmNow,
+                    ShareNext,
+                    Rfree,
+                    PermGroFac,
+                    CRRA,
+                    AdjustPrb,
+                    vPfuncAdj_next,
+                    dvdmFuncFxd_next,
+                    dvdsFuncFxd_next,
+                ),
+            )
 
         # Construct the end-of-period value function if requested
         if vFuncBool:
-            # Calculate end-of-period value, its derivative, and their pseudo-inverse
-            EndOfPrd_v = DiscFacEff * expected(
-                calc_EndOfPrd_v, ShockDstn, args=(aNrmNow, ShareNext)
+            # Calculate the pseudo-inverse of end-of-period marginal value, value,
+            # and the derivative of the latter in one pass
+            EndOfPrd_dvdaNvrs, EndOfPrd_vNvrs, EndOfPrd_vNvrsP = _calc_EndOfPrd_Nvrs(
+                EndOfPrd_dvda, EndOfPrd_v, CRRA
             )
-            EndOfPrd_vNvrs = uFunc.inv(EndOfPrd_v)
-
-            # value transformed through inverse utility
-            EndOfPrd_vNvrsP = EndOfPrd_dvda * uFunc.derinv(EndOfPrd_v, order=(0, 1))
 
             # Construct the end-of-period value function
-            EndOfPrd_vNvrsFunc_by_Share = []
-            for j in range(ShareCount):
-                EndOfPrd_vNvrsFunc_by_Share.append(
-                    CubicInterp(
-                        aNrmNow[:, j], EndOfPrd_vNvrs[:, j], EndOfPrd_vNvrsP[:, j]
-                    )
-                )
+            EndOfPrd_vNvrsFunc_by_Share = _make_CubicInterp_by_Share(
+                aNrmGrid, EndOfPrd_vNvrs, EndOfPrd_vNvrsP
+            )
             EndOfPrd_vNvrsFunc = LinearInterpOnInterp1D(
                 EndOfPrd_vNvrsFunc_by_Share, ShareGrid
             )
             EndOfPrd_vFunc = ValueFuncCRRA(EndOfPrd_vNvrsFunc, CRRA)
+        else:
+            EndOfPrd_dvdaNvrs = uFunc.derinv(EndOfPrd_dvda)
 
     # Find the optimal risky asset share either by choosing the best value among
     # the discrete grid choices, or by satisfying the FOC with equality (continuous)
@@ -776,25 +1683,21 @@ def solve_one_period_ConsPortfolio(
         FOC_s = EndOfPrd_dvds  # Relabel for convenient typing
 
         # For each value of aNrm, find the value of Share such that FOC_s == 0
-        crossing = np.logical_and(FOC_s[:, 1:] <= 0.0, FOC_s[:, :-1] >= 0.0)
-        share_idx = np.argmax(crossing, axis=1)
+        share_idx = _find_FOC_crossing(FOC_s)
         # This represents the index of the segment of the share grid where dvds flips
         # from positive to negative, indicating that there's a zero *on* the segment
 
         # Calculate the fractional distance between those share gridpoints where the
         # zero should be found, assuming a linear function; call it alpha
-        a_idx = np.arange(aNrmCount)
-        bot_s = ShareGrid[share_idx]
-        top_s = ShareGrid[share_idx + 1]
-        bot_f = FOC_s[a_idx, share_idx]
-        top_f = FOC_s[a_idx, share_idx + 1]
-        bot_c = EndOfPrd_dvdaNvrs[a_idx, share_idx]
-        top_c = EndOfPrd_dvdaNvrs[a_idx, share_idx + 1]
+        pair_idx = np.stack((share_idx, share_idx + 1), axis=1)
+        bot_s, top_s = ShareGrid[pair_idx].T
+        bot_f, top_f = np.take_along_axis(FOC_s, pair_idx, axis=1).T
+        bot_c, top_c = np.take_along_axis(EndOfPrd_dvdaNvrs, pair_idx, axis=1).T
         alpha = 1.0 - top_f / (top_f - bot_f)
 
         # Calculate the continuous optimal risky share and optimal consumption
-        ShareAdj_now = (1.0 - alpha) * bot_s + alpha * top_s
-        cNrmAdj_now = (1.0 - alpha) * bot_c + alpha * top_c
+        ShareAdj_now = bot_s + alpha * (top_s - bot_s)
+        cNrmAdj_now = bot_c + alpha * (top_c - bot_c)
 
         # If agent wants to put more than 100% into risky asset, he is constrained.
         # Likewise if he wants to put less than 0% into risky asset, he is constrained.
@@ -802,11 +1705,15 @@ def solve_one_period_ConsPortfolio(
         constrained_bot = FOC_s[:, 0] < 0.0
 
         # Apply those constraints to both risky share and consumption (but lower
-        # constraint should never be relevant)
-        ShareAdj_now[constrained_top] = 1.0
-        ShareAdj_now[constrained_bot] = 0.0
-        cNrmAdj_now[constrained_top] = EndOfPrd_dvdaNvrs[constrained_top, -1]
-        cNrmAdj_now[constrained_bot] = EndOfPrd_dvdaNvrs[constrained_bot, 0]
+        # constraint should never be relevant); the lower one takes precedence
+        ShareAdj_now = np.where(
+            constrained_bot, 0.0, np.where(constrained_top, 1.0, ShareAdj_now)
+        )
+        cNrmAdj_now = np.where(
+            constrained_bot,
+            EndOfPrd_dvdaNvrs[:, 0],
+            np.where(constrained_top, EndOfPrd_dvdaNvrs[:, -1], cNrmAdj_now),
+        )
 
     # When the natural borrowing constraint is *not* zero, then aNrm=0 is in the
     # grid, but there's no way to "optimize" the portfolio if a=0, and consumption
@@ -820,8 +1727,13 @@ def solve_one_period_ConsPortfolio(
 
     # Calculate the endogenous mNrm gridpoints when the agent adjusts his portfolio,
     # then construct the consumption function when the agent can adjust his share
-    mNrmAdj_now = np.insert(aNrmGrid + cNrmAdj_now, 0, 0.0)
-    cNrmAdj_now = np.insert(cNrmAdj_now, 0, 0.0)
+    mNrmAdj_now = np.empty(aNrmCount + 1)
+    mNrmAdj_now[0] = 0.0
+    np.add(aNrmGrid, cNrmAdj_now, out=mNrmAdj_now[1:])
+    cNrmAdj_ext = np.empty(aNrmCount + 1)
+    cNrmAdj_ext[0] = 0.0
+    cNrmAdj_ext[1:] = cNrmAdj_now
+    cNrmAdj_now = cNrmAdj_ext
     cFuncAdj_now = LinearInterp(mNrmAdj_now, cNrmAdj_now)
 
     # Construct the marginal value (of mNrm) function when the agent can adjust
@@ -829,19 +1741,29 @@ def solve_one_period_ConsPortfolio(
 
     # Construct the consumption function when the agent *can't* adjust the risky
     # share, as well as the marginal value of Share function
+    # Fill the gridpoints for all shares at once, one row per share, with a point
+    # at mNrm=0 prepended to each row
+    cNrmFxd_by_Share = np.empty((ShareCount, aNrmCount + 1))
+    cNrmFxd_by_Share[:, 0] = 0.0
+    cNrmFxd_by_Share[:, 1:] = EndOfPrd_dvdaNvrs.T
+    mNrmFxd_by_Share = np.empty((ShareCount, aNrmCount + 1))
+    mNrmFxd_by_Share[:, 0] = 0.0
+    np.add(aNrmGrid, cNrmFxd_by_Share[:, 1:], out=mNrmFxd_by_Share[:, 1:])
+    dvdsFxd_by_Share = np.empty((ShareCount, aNrmCount + 1))
+    dvdsFxd_by_Share[:, 0] = EndOfPrd_dvds[0, :]
+    dvdsFxd_by_Share[:, 1:] = EndOfPrd_dvds.T
     cFuncFxd_by_Share = []
     dvdsFuncFxd_by_Share = []
     for j in range(ShareCount):
-        cNrmFxd_temp = np.insert(EndOfPrd_dvdaNvrs[:, j], 0, 0.0)
-        mNrmFxd_temp = np.insert(aNrmGrid + cNrmFxd_temp[1:], 0, 0.0)
-        dvdsFxd_temp = np.insert(EndOfPrd_dvds[:, j], 0, EndOfPrd_dvds[0, j])
-        cFuncFxd_by_Share.append(LinearInterp(mNrmFxd_temp, cNrmFxd_temp))
-        dvdsFuncFxd_by_Share.append(LinearInterp(mNrmFxd_temp, dvdsFxd_temp))
+        cFuncFxd_by_Share.append(LinearInterp(mNrmFxd_by_Share[j], cNrmFxd_by_Share[j]))
+        dvdsFuncFxd_by_Share.append(
+            LinearInterp(mNrmFxd_by_Share[j], dvdsFxd_by_Share[j])
+        )
     cFuncFxd_now = LinearInterpOnInterp1D(cFuncFxd_by_Share, ShareGrid)
     dvdsFuncFxd_now = LinearInterpOnInterp1D(dvdsFuncFxd_by_Share, ShareGrid)
 
     # The share function when the agent can't adjust his portfolio is trivial
-    ShareFuncFxd_now = IdentityFunction(i_dim=1, n_dims=2)
+    ShareFuncFxd_now = _ShareFuncFxd
 
     # Construct the marginal value of mNrm function when the agent can't adjust his share
     dvdmFuncFxd_now = MargValueFuncCRRA(cFuncFxd_now, CRRA)
@@ -853,11 +1775,18 @@ def solve_one_period_ConsPortfolio(
         # like a step function, with jumps at the midpoints of mNrm gridpoints.
         # Because an actual step function would break our (assumed continuous) linear
         # interpolator, there's a *tiny* region with extremely high slope.
-        mNrmAdj_mid = (mNrmAdj_now[2:] + mNrmAdj_now[1:-1]) / 2
-        mNrmAdj_plus = mNrmAdj_mid * (1.0 + 1e-12)
-        mNrmAdj_comb = (np.transpose(np.vstack((mNrmAdj_mid, mNrmAdj_plus)))).flatten()
-        mNrmAdj_comb = np.append(np.insert(mNrmAdj_comb, 0, 0.0), mNrmAdj_now[-1])
-        Share_comb = (np.transpose(np.vstack((ShareAdj_now, ShareAdj_now)))).flatten()
+        # Fill the midpoints and the points just above them into alternating
+        # slots of one buffer, between mNrm=0 and the top gridpoint
+        mNrmAdj_comb = np.empty(2 * aNrmCount)
+        mNrmAdj_comb[0] = 0.0
+        mNrmAdj_mid = mNrmAdj_comb[1:-1:2]
+        np.add(mNrmAdj_now[2:], mNrmAdj_now[1:-1], out=mNrmAdj_mid)
+        mNrmAdj_mid /= 2
+        np.multiply(mNrmAdj_mid, 1.0 + 1e-12, out=mNrmAdj_comb[2:-1:2])
+        mNrmAdj_comb[-1] = mNrmAdj_now[-1]
+        Share_comb = np.empty(2 * aNrmCount)
+        Share_comb[0::2] = ShareAdj_now
+        Share_comb[1::2] = ShareAdj_now
         ShareFuncAdj_now = LinearInterp(mNrmAdj_comb, Share_comb)
 
     else:
@@ -866,16 +1795,19 @@ def solve_one_period_ConsPortfolio(
             Share_lower_bound = ShareLimit
         else:
             Share_lower_bound = 1.0
-        ShareAdj_now = np.insert(ShareAdj_now, 0, Share_lower_bound)
+        ShareAdj_ext = np.empty(aNrmCount + 1)
+        ShareAdj_ext[:1] = Share_lower_bound
+        ShareAdj_ext[1:] = ShareAdj_now
+        ShareAdj_now = ShareAdj_ext
         ShareFuncAdj_now = LinearInterp(mNrmAdj_now, ShareAdj_now, ShareLimit, 0.0)
 
     # This is a point at which (a,c,share) have consistent length. Take the
     # snapshot for storing the grid and values in the solution.
     save_points = {
-        "a": deepcopy(aNrmGrid),
+        "a": aNrmGrid.copy(),
         "eop_dvda_adj": uFunc.der(cNrmAdj_now),
-        "share_adj": deepcopy(ShareAdj_now),
-        "share_grid": deepcopy(ShareGrid),
+        "share_adj": ShareAdj_now.copy(),
+        "share_grid": ShareGrid.copy(),
         "eop_dvda_fxd": uFunc.der(EndOfPrd_dvda),
         "eop_dvds_fxd": EndOfPrd_dvds,
     }
@@ -886,38 +1818,52 @@ def solve_one_period_ConsPortfolio(
         # mNrm when agent can adjust his portfolio, and over market resources and
         # fixed share when agent can not adjust his portfolio.
 
+        # Both value functions are built on aXtraGrid with a point at mNrm=0
+        # prepended; fill the gridpoints into buffers of that length
+        mNrmCount = aXtraGrid.size + 1
+        mNrm_ext = np.empty(mNrmCount)
+        mNrm_ext[0] = 0.0
+        mNrm_ext[1:] = aXtraGrid
+
         # Construct the value function when the agent can adjust his portfolio
         mNrm_temp = aXtraGrid  # Just use aXtraGrid as our grid of mNrm values
         cNrm_temp = cFuncAdj_now(mNrm_temp)
         aNrm_temp = np.maximum(mNrm_temp - cNrm_temp, 0.0)  # Fix tiny violations
         Share_temp = ShareFuncAdj_now(mNrm_temp)
         v_temp = uFunc(cNrm_temp) + EndOfPrd_vFunc(aNrm_temp, Share_temp)
-        vNvrs_temp = uFunc.inv(v_temp)
-        vNvrsP_temp = uFunc.der(cNrm_temp) * uFunc.inverse(v_temp, order=(0, 1))
+        vNvrs_ext = np.empty(mNrmCount)
+        vNvrs_ext[0] = 0.0
+        vNvrs_ext[1:] = uFunc.inv(v_temp)
+        vNvrsP_ext = np.empty(mNrmCount)
+        vNvrsP_ext[1:] = uFunc.der(cNrm_temp) * uFunc.inverse(v_temp, order=(0, 1))
+        vNvrsP_ext[0] = vNvrsP_ext[1]
         vNvrsFuncAdj = CubicInterp(
-            np.insert(mNrm_temp, 0, 0.0),  # x_list
-            np.insert(vNvrs_temp, 0, 0.0),  # f_list
-            np.insert(vNvrsP_temp, 0, vNvrsP_temp[0]),  # dfdx_list
+            mNrm_ext,  # x_list
+            vNvrs_ext,  # f_list
+            vNvrsP_ext,  # dfdx_list
         )
         # Re-curve the pseudo-inverse value function
         vFuncAdj_now = ValueFuncCRRA(vNvrsFuncAdj, CRRA)
 
         # Construct the value function when the agent *can't* adjust his portfolio
-        mNrm_temp, Share_temp = np.meshgrid(aXtraGrid, ShareGrid)
+        mNrm_temp = np.broadcast_to(
+            aXtraGrid[:, np.newaxis], (aXtraGrid.size, ShareCount)
+        )
+        Share_temp = np.broadcast_to(ShareGrid[np.newaxis, :], mNrm_temp.shape)
         cNrm_temp = cFuncFxd_now(mNrm_temp, Share_temp)
         aNrm_temp = mNrm_temp - cNrm_temp
         v_temp = uFunc(cNrm_temp) + EndOfPrd_vFunc(aNrm_temp, Share_temp)
-        vNvrs_temp = uFunc.inv(v_temp)
-        vNvrsP_temp = uFunc.der(cNrm_temp) * uFunc.inverse(v_temp, order=(0, 1))
-        vNvrsFuncFxd_by_Share = []
-        for j in range(ShareCount):
-            vNvrsFuncFxd_by_Share.append(
-                CubicInterp(
-                    np.insert(mNrm_temp[:, 0], 0, 0.0),  # x_list
-                    np.insert(vNvrs_temp[:, j], 0, 0.0),  # f_list
-                    np.insert(vNvrsP_temp[:, j], 0, vNvrsP_temp[j, 0]),  # dfdx_list
-                )
-            )
+        vNvrs_ext = np.empty((mNrmCount, ShareCount))
+        vNvrs_ext[0] = 0.0
+        vNvrs_ext[1:] = uFunc.inv(v_temp)
+        vNvrsP_ext = np.empty((mNrmCount, ShareCount))
+        vNvrsP_ext[1:] = uFunc.der(cNrm_temp) * uFunc.inverse(v_temp, order=(0, 1))
+        vNvrsP_ext[0] = vNvrsP_ext[1]
+        vNvrsFuncFxd_by_Share = _make_CubicInterp_by_Share(
+            mNrm_ext,  # x_list
+            vNvrs_ext,  # f_list
+            vNvrsP_ext,  # dfdx_list
+        )
         vNvrsFuncFxd = LinearInterpOnInterp1D(vNvrsFuncFxd_by_Share, ShareGrid)
         vFuncFxd_now = ValueFuncCRRA(vNvrsFuncFxd, CRRA)
 
@@ -962,6 +1908,8 @@ init_portfolio["ShareCount"] = 25
 init_portfolio["AdjustPrb"] = 1.0
 # Flag for whether to optimize risky share on a discrete grid only
 init_portfolio["DiscreteShareBool"] = False
+# Floating point type for the intermediate value tables used in the solver
+init_portfolio["TableDtype"] = np.float64
 
 # Adjust some of the existing parameters in the dictionary
 init_portfolio["aXtraMax"] = 100  # Make the grid of assets go much higher...
@@ -53,6 +53,16 @@ class testBequestWarmGlowPortfolioType(unittest.TestCase):
     #     mNrm = 10.0
     #     self.assertAlmostEqual(vFunc(mNrm), -0.0000, places=HARK_PRECISION)
 
+    def test_value_fixed_share(self):
+        solution = self.agent.solution[0]
+        mNrm = 10.0
+        Share = solution.ShareFuncAdj(mNrm)
+        self.assertAlmostEqual(
+            solution.vFuncFxd(mNrm, Share).tolist(),
+            solution.vFuncAdj(mNrm).tolist(),
+            places=HARK_PRECISION,
+        )
+
     def test_simulation(self):
         self.agent.T_sim = 10
         self.agent.track_vars = ["mNrm", "cNrm", "aNrm", "Share"]
@@ -1,8 +1,11 @@
 import unittest
+import warnings
+from unittest import mock
 
 import numpy as np
 
 import HARK.ConsumptionSaving.ConsPortfolioModel as cpm
+from HARK.distribution import expected
 from HARK.tests import HARK_PRECISION
 
 
@@ -172,6 +175,45 @@ class testPortfolioConsumerTypeSticky(unittest.TestCase):
 
         self.sticky.solve()
 
+    def test_sticky_vFunc(self):
+        # Same as above, but also construct the value function
+        init_sticky_share = cpm.init_portfolio.copy()
+        init_sticky_share["AdjustPrb"] = 0.15
+        init_sticky_share["vFuncBool"] = True
+
+        # Create and solve portfolio choice consumer type
+        self.sticky = cpm.PortfolioConsumerType(**init_sticky_share)
+        self.sticky.solve()
+
+        self.assertTrue(np.isfinite(self.sticky.solution[0].vFuncFxd(10.0, 0.5)))
+
+        # Being stuck at the optimal share is as good as being able to adjust
+        ShareOpt = self.sticky.solution[0].ShareFuncAdj(10.0)
+        self.assertAlmostEqual(
+            self.sticky.solution[0].vFuncFxd(10.0, ShareOpt).tolist(),
+            self.sticky.solution[0].vFuncAdj(10.0).tolist(),
+            places=HARK_PRECISION,
+        )
+
+    def test_sticky_simulation(self):
+        init_sticky_share = cpm.init_portfolio.copy()
+        init_sticky_share["AdjustPrb"] = 0.15
+        init_sticky_share["T_sim"] = 10
+        init_sticky_share["AgentCount"] = 20
+
+        # Create, solve, and simulate portfolio choice consumer type
+        self.sticky = cpm.PortfolioConsumerType(**init_sticky_share)
+        self.sticky.cycles = 0
+        self.sticky.solve()
+        self.sticky.track_vars += ["cNrm", "Share", "Adjust"]
+        self.sticky.initialize_sim()
+        self.sticky.simulate()
+
+        # Agents who can't adjust keep their share from last period, so their
+        # controls should be well defined
+        self.assertTrue(np.all(np.isfinite(self.sticky.history["cNrm"])))
+        self.assertTrue(np.all(np.isfinite(self.sticky.history["Share"])))
+
 
 class testPortfolioConsumerTypeDiscrete(unittest.TestCase):
     def test_discrete(self):
@@ -217,6 +259,253 @@ class testPortfolioConsumerTypeDiscreteAndJoint(unittest.TestCase):
         self.discrete_and_joint.solve()
 
 
+class testPortfolioConsumerTypeFxdTables(unittest.TestCase):
+    """
+    Check that the kernels reading next period's fixed share functions from
+    their gridpoints match evaluating the interpolants themselves.
+    """
+
+    def setUp(self):
+        init_sticky_share = cpm.init_portfolio.copy()
+        init_sticky_share["AdjustPrb"] = 0.5
+        init_sticky_share["vFuncBool"] = True
+        self.agent = cpm.PortfolioConsumerType(**init_sticky_share)
+        self.agent.solve()
+        self.solution_next = self.agent.solution[0]
+        self.ShareGrid = self.agent.ShareGrid
+
+        # Realizations of next period's market resources over bNrm and income shocks
+        IncShkDstn = self.agent.IncShkDstn[0]
+        PermGroShk = IncShkDstn.atoms[0] * self.agent.PermGroFac[0]
+        bNrm = np.linspace(0.0, 50.0, 41)
+        self.mNrm_next = bNrm[:, np.newaxis] / PermGroShk + IncShkDstn.atoms[1]
+        self.weights_dvdm = IncShkDstn.pmv * PermGroShk ** (-self.agent.CRRA)
+        self.weights_v = self.weights_dvdm * PermGroShk
+        self.mNrm_next_by_bz = np.broadcast_to(
+            self.mNrm_next[:, np.newaxis, :],
+            (bNrm.size, self.ShareGrid.size, PermGroShk.size),
+        )
+        self.Share_next_by_bz = np.broadcast_to(
+            self.ShareGrid[np.newaxis, :, np.newaxis], self.mNrm_next_by_bz.shape
+        )
+
+    def test_Fxd_tables(self):
+        FxdTables = cpm._get_Fxd_tables(self.solution_next, self.ShareGrid)
+        self.assertIsNotNone(FxdTables)
+        dvdm_exp, dvds_exp = cpm._calc_exp_Fxd_by_bz(
+            self.mNrm_next, *FxdTables, self.weights_dvdm, self.weights_v
+        )
+
+        dvdm_next = self.solution_next.dvdmFuncFxd(
+            self.mNrm_next_by_bz, self.Share_next_by_bz
+        )
+        dvds_next = self.solution_next.dvdsFuncFxd(
+            self.mNrm_next_by_bz, self.Share_next_by_bz
+        )
+        np.testing.assert_allclose(dvdm_exp, np.dot(dvdm_next, self.weights_dvdm))
+        np.testing.assert_allclose(dvds_exp, np.dot(dvds_next, self.weights_v))
+
+    def test_vFxd_tables(self):
+        vFxdTables = cpm._get_vFxd_tables(self.solution_next, self.ShareGrid)
+        self.assertIsNotNone(vFxdTables)
+        vFxd_next = self.solution_next.vFuncFxd(
+            self.mNrm_next_by_bz, self.Share_next_by_bz
+        )
+
+        v_exp = cpm._calc_exp_vFxd_by_bz(self.mNrm_next, *vFxdTables, self.weights_v)
+        np.testing.assert_allclose(v_exp, np.dot(vFxd_next, self.weights_v))
+
+        v_next = cpm._eval_vFxd_tables_by_Share(
+            np.ascontiguousarray(self.mNrm_next_by_bz), *vFxdTables
+        )
+        np.testing.assert_allclose(v_next, vFxd_next)
+
+    def test_joint_tables(self):
+        AdjTable = cpm._get_Adj_table(self.solution_next)
+        FxdTables = cpm._get_Fxd_tables(self.solution_next, self.ShareGrid)
+        self.assertIsNotNone(AdjTable)
+        self.assertIsNotNone(FxdTables)
+        ShockDstn = self.agent.ShockDstn[0]
+        aNrmGrid = self.agent.aXtraGrid
+        args = (
+            self.agent.Rfree,
+            self.agent.PermGroFac[0],
+            self.agent.CRRA,
+            self.agent.AdjustPrb,
+        )
+        EndOfPrd_dvda, EndOfPrd_dvds = cpm._calc_EndOfPrd_dvdx_joint_tab(
+            aNrmGrid,
+            self.ShareGrid,
+            ShockDstn.variables["PermShk"].values,
+            ShockDstn.variables["TranShk"].values,
+            ShockDstn.variables["Risky"].values,
+            ShockDstn.pmv,
+            *args,
+            *AdjTable,
+            *FxdTables,
+        )
+
+        EndOfPrd_dvda_fb, EndOfPrd_dvds_fb = expected(
+            cpm._calc_EndOfPrd_dvdx_joint,
+            ShockDstn,
+            args=(
+                aNrmGrid[:, np.newaxis],
+                self.ShareGrid[np.newaxis, :],
+                *args,
+                self.solution_next.vPfuncAdj,
+                self.solution_next.dvdmFuncFxd,
+                self.solution_next.dvdsFuncFxd,
+            ),
+        )
+        np.testing.assert_allclose(EndOfPrd_dvda, EndOfPrd_dvda_fb)
+        np.testing.assert_allclose(EndOfPrd_dvds, EndOfPrd_dvds_fb)
+
+
+class testPortfolioConsumerTypeFloat32Tables(unittest.TestCase):
+    def test_float32_tables(self):
+        # Store the intermediate value tables in single precision
+        self.float32_tables = cpm.PortfolioConsumerType(TableDtype=np.float32)
+        self.float32_tables.cycles = 0
+
+        # Solve model under given parameters
+        self.float32_tables.solve()
+
+        self.assertAlmostEqual(
+            self.float32_tables.solution[0].cFuncAdj(10).tolist(),
+            1.69966,
+            places=HARK_PRECISION,
+        )
+        self.assertAlmostEqual(
+            self.float32_tables.solution[0].ShareFuncAdj(10).tolist(),
+            0.84985,
+            places=HARK_PRECISION,
+        )
+
+    def test_float32_tables_vFunc(self):
+        # Same as above, but also construct the value function
+        self.float32_tables = cpm.PortfolioConsumerType(
+            TableDtype=np.float32, vFuncBool=True
+        )
+        self.float32_tables.cycles = 0
+
+        # Solve model under given parameters
+        self.float32_tables.solve()
+
+        self.assertAlmostEqual(
+            self.float32_tables.solution[0].cFuncAdj(10).tolist(),
+            1.69966,
+            places=HARK_PRECISION,
+        )
+        self.assertAlmostEqual(
+            self.float32_tables.solution[0].vFuncAdj(10).tolist(),
+            -0.46259,
+            places=HARK_PRECISION,
+        )
+
+
+class testPortfolioConsumerTypeUpdates(unittest.TestCase):
+    def assertSameSolution(self, agent, params):
+        # Solving after an update should match a type created with those parameters
+        fresh = cpm.PortfolioConsumerType(**params)
+        agent.solve()
+        fresh.solve()
+        self.assertEqual(agent.solution[0].aGrid.size, fresh.solution[0].aGrid.size)
+        self.assertAlmostEqual(
+            agent.solution[0].cFuncAdj(10).tolist(),
+            fresh.solution[0].cFuncAdj(10).tolist(),
+            places=12,
+        )
+        self.assertAlmostEqual(
+            agent.solution[0].ShareFuncAdj(10).tolist(),
+            fresh.solution[0].ShareFuncAdj(10).tolist(),
+            places=12,
+        )
+
+    def test_update_RiskyDstn(self):
+        agent = cpm.PortfolioConsumerType()
+        RiskyMax = agent.RiskyMax
+        agent.RiskyStd = 0.1
+        agent.update_RiskyDstn()
+        agent.update_ShockDstn()
+        self.assertLess(agent.RiskyMax, RiskyMax)
+        self.assertSameSolution(agent, {"RiskyStd": 0.1})
+
+    def test_replace_RiskyDstn(self):
+        # The bounds on risky returns follow RiskyDstn even if it is set directly
+        agent = cpm.PortfolioConsumerType()
+        agent.RiskyDstn = cpm.PortfolioConsumerType(RiskyStd=0.1).RiskyDstn
+        agent.update_ShockDstn()
+        self.assertSameSolution(agent, {"RiskyStd": 0.1})
+
+    def test_update_assets_grid(self):
+        # The grids built for the first solve must be rebuilt after the update
+        agent = cpm.PortfolioConsumerType()
+        agent.solve()
+        self.assertEqual(agent.aNrmGrid[0].size, agent.aXtraCount + 1)
+        agent.aXtraCount = 60
+        agent.update_assets_grid()
+        self.assertSameSolution(agent, {"aXtraCount": 60})
+
+    def test_update_income_process(self):
+        # With no income in unemployment the natural borrowing constraint is zero
+        agent = cpm.PortfolioConsumerType()
+        self.assertFalse(agent.BoroCnstNat_iszero[0])
+        agent.IncUnemp = 0.0
+        agent.update_income_process()
+        agent.update_ShockDstn()
+        self.assertTrue(agent.BoroCnstNat_iszero[0])
+        # ShareLimit is an array, which must not be converted to a scalar implicitly
+        with warnings.catch_warnings():
+            warnings.filterwarnings("error", message="Conversion of an array")
+            self.assertSameSolution(agent, {"IncUnemp": 0.0})
+
+
+class testPortfolioConsumerTypeThreadedControls(unittest.TestCase):
+    def setUp(self):
+        self.params = cpm.init_portfolio.copy()
+        self.params.update(
+            {
+                "cycles": 1,
+                "T_cycle": 3,
+                "T_age": 3,
+                "Rfree": [1.0, 0.99, 0.98],
+                "RiskyAvg": [1.01, 1.02, 1.03],
+                "RiskyStd": [0.1, 0.1, 0.1],
+                "RiskyCount": 3,
+                "AdjustPrb": [0.5, 0.3, 0.7],
+                "PermGroFac": [1.0, 1.01, 1.0],
+                "LivPrb": [0.9, 0.9, 0.9],
+                "PermShkStd": [0.1, 0.1, 0.1],
+                "TranShkStd": [0.1, 0.1, 0.1],
+                "T_sim": 10,
+                "sim_common_Rrisky": False,
+                "AgentCount": 200,
+            }
+        )
+
+    def simulate(self):
+        agent = cpm.PortfolioConsumerType(**self.params)
+        agent.track_vars = ["cNrm", "Share", "Adjust"]
+        agent.solve()
+        agent.initialize_sim()
+        agent.simulate()
+        return agent.history
+
+    def test_threaded_controls(self):
+        serial = self.simulate()
+        with mock.patch.object(
+            cpm, "_THREADED_CONTROLS_MIN_AGENTS", 0
+        ), mock.patch.object(
+            cpm, "ThreadPoolExecutor", wraps=cpm.ThreadPoolExecutor
+        ) as executor:
+            threaded = self.simulate()
+        self.assertTrue(executor.called)
+
+        np.testing.assert_array_equal(threaded["Adjust"], serial["Adjust"])
+        np.testing.assert_array_equal(threaded["cNrm"], serial["cNrm"])
+        np.testing.assert_array_equal(threaded["Share"], serial["Share"])
+
+
 class testRiskyReturnDim(PortfolioConsumerTypeTestCase):
     def test_simulation(self):
         # Setup
@@ -1,6 +1,7 @@
 import numpy as np
 from interpolation.splines import CGrid, eval_linear, eval_spline
 from interpolation.splines import extrap_options as xto
+from numba import njit
 
 from HARK.metric import MetricObject
 
@@ -11,6 +12,108 @@ extrap_opts = {
 }
 
 
+@njit(cache=True)
+def _locate(grid, x):
+    """
+    Finds the grid segment of each point in x, using the segment to the left
+    of a gridpoint and the first or last segment for points off the grid.
+    Returns the segment indices, the relative positions of the points within
+    their segments, and the inverse of the segment widths.
+    """
+    idx = np.searchsorted(grid, x) - 1
+    idx = np.minimum(np.maximum(idx, 0), grid.size - 2)
+    inv_h = 1.0 / (grid[idx + 1] - grid[idx])
+    return idx, (x - grid[idx]) * inv_h, inv_h
+
+
+@njit(cache=True)
+def _eval_and_grad_1d(f_val, grid0, x0):
+    """
+    Evaluates a 1D linear interpolator and its derivative, extrapolating
+    linearly off the grid.
+    """
+    i, w, inv_h = _locate(grid0, x0)
+    f0 = f_val[i]
+    f1 = f_val[i + 1]
+    return f0 + w * (f1 - f0), ((f1 - f0) * inv_h,)
+
+
+@njit(cache=True)
+def _eval_and_grad_2d(f_val, grid0, grid1, x0, x1):
+    """
+    Evaluates a bilinear interpolator and its gradient, extrapolating
+    linearly off the grid.
+    """
+    i, wx, inv_hx = _locate(grid0, x0)
+    j, wy, inv_hy = _locate(grid1, x1)
+    n = x0.size
+    f = np.empty(n)
+    dfdx = np.empty(n)
+    dfdy = np.empty(n)
+    for k in range(n):
+        f00 = f_val[i[k], j[k]]
+        f01 = f_val[i[k], j[k] + 1]
+        f10 = f_val[i[k] + 1, j[k]]
+        f11 = f_val[i[k] + 1, j[k] + 1]
+        f0 = f00 + wy[k] * (f01 - f00)
+        f1 = f10 + wy[k] * (f11 - f10)
+        f[k] = f0 + wx[k] * (f1 - f0)
+        dfdx[k] = (f1 - f0) * inv_hx[k]
+        dfdy[k] = ((1.0 - wx[k]) * (f01 - f00) + wx[k] * (f11 - f10)) * inv_hy[k]
+    return f, (dfdx, dfdy)
+
+
+@njit(cache=True)
+def _eval_and_grad_3d(f_val, grid0, grid1, grid2, x0, x1, x2):
+    """
+    Evaluates a trilinear interpolator and its gradient, extrapolating
+    linearly off the grid.
+    """
+    i, wx, inv_hx = _locate(grid0, x0)
+    j, wy, inv_hy = _locate(grid1, x1)
+    l, wz, inv_hz = _locate(grid2, x2)
+    n = x0.size
+    f = np.empty(n)
+    dfdx = np.empty(n)
+    dfdy = np.empty(n)
+    dfdz = np.empty(n)
+    for k in range(n):
+        # Interpolate along z on the four edges of the cell
+        f000 = f_val[i[k], j[k], l[k]]
+        f001 = f_val[i[k], j[k], l[k] + 1]
+        f010 = f_val[i[k], j[k] + 1, l[k]]
+        f011 = f_val[i[k], j[k] + 1, l[k] + 1]
+        f100 = f_val[i[k] + 1, j[k], l[k]]
+        f101 = f_val[i[k] + 1, j[k], l[k] + 1]
+        f110 = f_val[i[k] + 1, j[k] + 1, l[k]]
+        f111 = f_val[i[k] + 1, j[k] + 1, l[k] + 1]
+        f00 = f000 + wz[k] * (f001 - f000)
+        f01 = f010 + wz[k] * (f011 - f010)
+        f10 = f100 + wz[k] * (f101 - f100)
+        f11 = f110 + wz[k] * (f111 - f110)
+
+        # Then along y and x
+        f0 = f00 + wy[k] * (f01 - f00)
+        f1 = f10 + wy[k] * (f11 - f10)
+        f[k] = f0 + wx[k] * (f1 - f0)
+        dfdx[k] = (f1 - f0) * inv_hx[k]
+        dfdy[k] = ((1.0 - wx[k]) * (f01 - f00) + wx[k] * (f11 - f10)) * inv_hy[k]
+
+        # The z slope is the x-y interpolation of the slopes on the four edges
+        dz0 = (1.0 - wy[k]) * (f001 - f000) + wy[k] * (f011 - f010)
+        dz1 = (1.0 - wy[k]) * (f101 - f100) + wy[k] * (f111 - f110)
+        dfdz[k] = ((1.0 - wx[k]) * dz0 + wx[k] * dz1) * inv_hz[k]
+    return f, (dfdx, dfdy, dfdz)
+
+
+# Specialized evaluation and gradient kernels by number of dimensions
+_EVAL_AND_GRAD_IMPLS = {
+    1: _eval_and_grad_1d,
+    2: _eval_and_grad_2d,
+    3: _eval_and_grad_3d,
+}
+
+
 class LinearFast(MetricObject):
     """
     A class that constructs and holds all the necessary elements to
@@ -123,6 +226,45 @@ class LinearFast(MetricObject):
 
         return derivs
 
+    def _has_kernel(self):
+        """
+        Checks whether there is a specialized kernel for the gradient of this
+        interpolator, which is the case for multilinear extrapolation in up
+        to three dimensions.
+        """
+        return self.extrap_mode == "linear" and self.dim in _EVAL_AND_GRAD_IMPLS
+
+    def _kernel_eval_and_grad(self, *args):
+        """
+        Evaluates the interpolator and its gradient with the specialized
+        kernel for its number of dimensions.
+
+        Parameters
+        ----------
+        args: [numpy.array]
+            List of arrays. The i-th entry contains the i-th coordinate
+            of all the points to be evaluated. All entries must have the
+            same shape.
+
+        Returns
+        -------
+        numpy.array
+            Value of the interpolator at given arguments.
+        [numpy.array]
+            List of the derivatives of the function with respect to each
+            input, evaluated at the given points.
+        """
+        array_args = [np.asarray(x, dtype=float) for x in args]
+        shape = array_args[0].shape
+
+        f, grad = _EVAL_AND_GRAD_IMPLS[self.dim](
+            np.asarray(self.f_val, dtype=float),
+            *[np.asarray(grid, dtype=float) for grid in self.grid_list],
+            *[x.ravel() for x in array_args],
+        )
+
+        return f.reshape(shape), [der.reshape(shape) for der in grad]
+
     def gradient(self, *args):
         """
         Evaluates gradient of the interpolator.
@@ -143,6 +285,9 @@ class LinearFast(MetricObject):
             [df/dx(x,y,z), df/dy(x,y,z), df/dz(x,y,z)]. Each element has the
             shape of items in args.
         """
+        if self._has_kernel():
+            return self._kernel_eval_and_grad(*args)[1]
+
         # Form a tuple that indicates which derivatives to get
         # in the way eval_linear expects
         deriv_tup = tuple(
@@ -173,6 +318,9 @@ class LinearFast(MetricObject):
             [df/dx(x,y,z), df/dy(x,y,z), df/dz(x,y,z)]. Each element has the
             shape of items in args.
         """
+        if self._has_kernel():
+            return self._kernel_eval_and_grad(*args)
+
         # (0,0,...,0) to get the function evaluation
         eval_tup = tuple([tuple(0 for i in range(self.dim))])
 
@@ -13,7 +13,7 @@ from copy import deepcopy
 import numpy as np
 from scipy.interpolate import CubicHermiteSpline
 
-from HARK.metric import MetricObject
+from HARK.metric import MetricObject, distance_metric
 from HARK.rewards import CRRAutility, CRRAutilityP, CRRAutilityPP
 
 
@@ -926,6 +926,53 @@ class CubicInterp(HARKinterpolator1D):
         slope_limit=None,
         lower_extrap=False,
     ):
+        self._set_gridpoints(x_list, y_list, dydx_list)
+        self.coeffs = self.calc_coeffs(
+            self.x_list,
+            self.y_list,
+            self.dydx_list,
+            intercept_limit,
+            slope_limit,
+            lower_extrap,
+        )
+
+    @classmethod
+    def from_coeffs(cls, x_list, y_list, dydx_list, coeffs):
+        """
+        Make a cubic spline interpolant from coefficients that were already
+        calculated by calc_coeffs, rather than calculating them again. This is
+        useful when the coefficients of many functions on the same gridpoints
+        have been calculated at once.
+
+        Parameters
+        ----------
+        x_list : np.array
+            List of x values composing the grid.
+        y_list : np.array
+            List of y values, representing f(x) at the points in x_list.
+        dydx_list : np.array
+            List of dydx values, representing f'(x) at the points in x_list
+        coeffs : np.array
+            Interpolation coefficients of shape (len(x_list) + 1, 4), as
+            returned by calc_coeffs.
+
+        Returns
+        -------
+        interp : CubicInterp
+            The interpolant with the given gridpoints and coefficients.
+        """
+        interp = cls.__new__(cls)
+        interp._set_gridpoints(x_list, y_list, dydx_list)
+        coeffs = np.asarray(coeffs)
+        if coeffs.shape != (interp.n + 1, 4):
+            raise ValueError("Coefficients do not match the grid dimensions")
+        interp.coeffs = coeffs
+        return interp
+
+    def _set_gridpoints(self, x_list, y_list, dydx_list):
+        """
+        Store the gridpoints as flat arrays, checking that their sizes match.
+        """
         self.x_list = (
             np.asarray(x_list)
             if _check_flatten(1, x_list)
@@ -946,49 +993,82 @@ class CubicInterp(HARKinterpolator1D):
 
         self.n = len(x_list)
 
+    @staticmethod
+    def calc_coeffs(
+        x_list,
+        y_list,
+        dydx_list,
+        intercept_limit=None,
+        slope_limit=None,
+        lower_extrap=False,
+    ):
+        """
+        Calculate the interpolation coefficients of a cubic spline. y_list and
+        dydx_list may have leading axes, in which case the coefficients of one
+        spline per entry of those axes, all on gridpoints x_list, are calculated
+        at once.
+
+        Parameters
+        ----------
+        x_list : np.array
+            List of x values composing the grid.
+        y_list : np.array
+            Values of f(x) at the points in x_list, along the last axis.
+        dydx_list : np.array
+            Values of f'(x) at the points in x_list, along the last axis.
+        intercept_limit : float
+            Intercept of limiting linear function.
+        slope_limit : float
+            Slope of limiting linear function.
+        lower_extrap : boolean
+            Indicator for whether lower extrapolation is allowed.
+
+        Returns
+        -------
+        coeffs : np.array
+            Array of shape y_list.shape[:-1] + (len(x_list) + 1, 4), holding the
+            coefficients below the grid, on each segment, and above the grid.
+        """
+        x_list = np.asarray(x_list)
+        y_list = np.asarray(y_list)
+        dydx_list = np.asarray(dydx_list)
+        n = x_list.size
+        coeffs = np.empty(y_list.shape[:-1] + (n + 1, 4))
+
         # Define lower extrapolation as linear function (or just NaN)
         if lower_extrap:
-            self.coeffs = [[y_list[0], dydx_list[0], 0, 0]]
+            coeffs[..., 0, 0] = y_list[..., 0]
+            coeffs[..., 0, 1] = dydx_list[..., 0]
+            coeffs[..., 0, 2:] = 0.0
         else:
-            self.coeffs = [[np.nan, np.nan, np.nan, np.nan]]
+            coeffs[..., 0, :] = np.nan
 
         # Calculate interpolation coefficients on segments mapped to [0,1]
-        for i in range(self.n - 1):
-            x0 = x_list[i]
-            y0 = y_list[i]
-            x1 = x_list[i + 1]
-            y1 = y_list[i + 1]
-            Span = x1 - x0
-            dydx0 = dydx_list[i] * Span
-            dydx1 = dydx_list[i + 1] * Span
-
-            temp = [
-                y0,
-                dydx0,
-                3 * (y1 - y0) - 2 * dydx0 - dydx1,
-                2 * (y0 - y1) + dydx0 + dydx1,
-            ]
-            self.coeffs.append(temp)
+        y0 = y_list[..., :-1]
+        y1 = y_list[..., 1:]
+        Span = x_list[1:] - x_list[:-1]
+        dydx0 = dydx_list[..., :-1] * Span
+        dydx1 = dydx_list[..., 1:] * Span
+        coeffs[..., 1:n, 0] = y0
+        coeffs[..., 1:n, 1] = dydx0
+        coeffs[..., 1:n, 2] = 3 * (y1 - y0) - 2 * dydx0 - dydx1
+        coeffs[..., 1:n, 3] = 2 * (y0 - y1) + dydx0 + dydx1
 
         # Calculate extrapolation coefficients as a decay toward limiting function y = mx+b
+        x1 = x_list[-1]
+        y1 = y_list[..., -1]
         if slope_limit is None and intercept_limit is None:
-            slope_limit = dydx_list[-1]
-            intercept_limit = y_list[-1] - slope_limit * x_list[-1]
+            slope_limit = dydx_list[..., -1]
+            intercept_limit = y1 - slope_limit * x1
         gap = slope_limit * x1 + intercept_limit - y1
-        slope = slope_limit - dydx_list[self.n - 1]
-        if (gap != 0) and (slope <= 0):
-            temp = [intercept_limit, slope_limit, gap, slope / gap]
-        elif slope > 0:
-            temp = [
-                intercept_limit,
-                slope_limit,
-                0,
-                0,
-            ]  # fixing a problem when slope is positive
-        else:
-            temp = [intercept_limit, slope_limit, gap, 0]
-        self.coeffs.append(temp)
-        self.coeffs = np.array(self.coeffs)
+        slope = slope_limit - dydx_list[..., -1]
+        decay = np.logical_and(gap != 0, slope <= 0)
+        coeffs[..., n, 0] = intercept_limit
+        coeffs[..., n, 1] = slope_limit
+        # Fixing a problem when slope is positive
+        coeffs[..., n, 2] = np.where(slope > 0, 0.0, gap)
+        coeffs[..., n, 3] = np.where(decay, slope / np.where(decay, gap, 1.0), 0.0)
+        return coeffs
 
     def _evaluate(self, x):
         """
@@ -2687,6 +2767,58 @@ class LinearInterpOnInterp1D(HARKinterpolator2D):
         self.y_list = y_values
         self.y_n = y_values.size
 
+    def distance(self, other):
+        """
+        Distance to another LinearInterpOnInterp1D, as in MetricObject.distance.
+        If both hold the same number of LinearInterp objects whose gridpoints all
+        have the same shape, the distance between the lists of 1D interpolators
+        is found by stacking their x_list and y_list arrays and comparing them in
+        one array operation rather than one pair of functions at a time.
+
+        Parameters
+        ----------
+        other : object
+            Another object to compare this instance to.
+
+        Returns
+        -------
+        (unnamed) : float
+            The distance between this object and another.
+        """
+        funcs_a = self.xInterpolators
+        funcs_b = getattr(other, "xInterpolators", None)
+        if (
+            type(other) is not type(self)
+            or not isinstance(funcs_a, list)
+            or not isinstance(funcs_b, list)
+            or len(funcs_a) == 0
+            or len(funcs_a) != len(funcs_b)
+            or any(type(f) is not LinearInterp for f in funcs_a + funcs_b)
+        ):
+            return super().distance(other)
+
+        shape = funcs_a[0].x_list.shape
+        if any(
+            f.x_list.shape != shape or f.y_list.shape != shape
+            for f in funcs_a + funcs_b
+        ):
+            return super().distance(other)
+
+        x_a = np.array([f.x_list for f in funcs_a])
+        x_b = np.array([f.x_list for f in funcs_b])
+        y_a = np.array([f.y_list for f in funcs_a])
+        y_b = np.array([f.y_list for f in funcs_b])
+        try:
+            return np.max(
+                [
+                    np.max(np.abs(x_a - x_b)),
+                    np.max(np.abs(y_a - y_b)),
+                    distance_metric(self.y_list, other.y_list),
+                ]
+            )
+        except (AttributeError, ValueError):
+            return 1000.0
+
     def _evaluate(self, x, y):
         """
         Returns the level of the interpolated function at each value in x,y.
@@ -263,6 +263,44 @@ class Check2DDerivatives(unittest.TestCase):
         self.assertTrue(np.allclose(grad[1], np.sin(x_ev) * (1 / y_ev), atol=0.02))
 
 
+class Check3DDerivatives(unittest.TestCase):
+    """
+    Checks derivatives in a 3D interpolator
+    """
+
+    def test_linear(self):
+        # A linear function on a non-uniform grid
+        x = np.exp(np.linspace(0, 2, 6))
+        y = np.power(np.linspace(0, 5, 10), 2)
+        z = np.linspace(-1, 1, 4)
+        x_tiled, y_tiled, z_tiled = np.meshgrid(x, y, z, indexing="ij")
+
+        inter = 1
+        slope_x = 2
+        slope_y = -3
+        slope_z = 0.5
+        f = inter + slope_x * x_tiled + slope_y * y_tiled + slope_z * z_tiled
+
+        interp = LinearFast(f, [x, y, z])
+
+        # Evaluation points
+        n_eval = 5
+        x_ev, y_ev, z_ev = np.meshgrid(
+            np.linspace(-20, 20, n_eval),
+            np.linspace(5, -5, n_eval),
+            np.linspace(-2, 2, n_eval),
+            indexing="ij",
+        )
+
+        # Function value and gradient
+        val, grad = interp._eval_and_grad(x_ev, y_ev, z_ev)
+
+        self.assertTrue(np.allclose(val, interp(x_ev, y_ev, z_ev)))
+        self.assertTrue(np.allclose(grad[0], np.ones_like(x_ev) * slope_x))
+        self.assertTrue(np.allclose(grad[1], np.ones_like(y_ev) * slope_y))
+        self.assertTrue(np.allclose(grad[2], np.ones_like(z_ev) * slope_z))
+
+
 class TestLinearDecay(unittest.TestCase):
     """
     Checks the linear interpolators with limiting extrapolators
@@ -8,7 +8,14 @@ import numpy as np
 
 from HARK.interpolation import BilinearInterp
 from HARK.interpolation import CubicHermiteInterp as CubicInterp
-from HARK.interpolation import LinearInterp, QuadlinearInterp, TrilinearInterp
+from HARK.interpolation import CubicInterp as CubicSplineInterp
+from HARK.interpolation import (
+    LinearInterp,
+    LinearInterpOnInterp1D,
+    QuadlinearInterp,
+    TrilinearInterp,
+)
+from HARK.metric import MetricObject
 
 
 class testsLinearInterp(unittest.TestCase):
@@ -80,6 +87,50 @@ class testsCubicInterp(unittest.TestCase):
         self.assertEqual(cube(1.5), 2.25)
 
 
+class testsCubicSplineInterpCoeffs(unittest.TestCase):
+    """tests for building CubicInterp from coefficients computed for several
+    functions on the same grid at once
+    """
+
+    def setUp(self):
+        self.x_array = np.array([0.5, 1.0, 2.0, 4.0, 8.0])
+        self.y_array = np.log(np.outer([1.0, 2.0, 3.0], self.x_array))
+        self.dydx_array = np.tile(1.0 / self.x_array, (3, 1))
+        self.y_array[2] = -1.0 / self.x_array
+        self.dydx_array[2] = 1.0 / self.x_array**2
+
+    def test_calc_coeffs(self):
+        coeffs = CubicSplineInterp.calc_coeffs(
+            self.x_array, self.y_array, self.dydx_array
+        )
+        for j in range(3):
+            f = CubicSplineInterp(self.x_array, self.y_array[j], self.dydx_array[j])
+            np.testing.assert_array_equal(coeffs[j], f.coeffs)
+
+    def test_from_coeffs(self):
+        coeffs = CubicSplineInterp.calc_coeffs(
+            self.x_array, self.y_array, self.dydx_array
+        )
+        x = np.linspace(0.5, 12.0, 40)
+        for j in range(3):
+            f = CubicSplineInterp(self.x_array, self.y_array[j], self.dydx_array[j])
+            g = CubicSplineInterp.from_coeffs(
+                self.x_array, self.y_array[j], self.dydx_array[j], coeffs[j]
+            )
+            np.testing.assert_array_equal(f(x), g(x))
+            np.testing.assert_array_equal(f.derivative(x), g.derivative(x))
+
+    def test_wrong_coeffs_shape(self):
+        self.assertRaises(
+            ValueError,
+            CubicSplineInterp.from_coeffs,
+            self.x_array,
+            self.y_array[0],
+            self.dydx_array[0],
+            np.zeros((self.x_array.size, 4)),
+        )
+
+
 class testsBilinearInterp(unittest.TestCase):
     """tests for BilinearInterp, currently tests for uneven length of
     x, y, f(x,y) with user input as arrays, arrays with column orientation
@@ -200,3 +251,37 @@ class testsQuadlinearInterp(unittest.TestCase):
             self.f_array, self.w_array, self.x_array, self.y_array_t, self.z_array
         )
         self.assertEqual(bilinear(1, 2, 1, 2), 6.0)
+
+
+class testsLinearInterpOnInterp1D(unittest.TestCase):
+    """tests for the distance between LinearInterpOnInterp1D objects, which
+    compares lists of LinearInterp objects with same-shaped grids all at once
+    """
+
+    def setUp(self):
+        self.y_values = np.array([0.0, 0.5, 1.0])
+        x = np.linspace(0.0, 10.0, 11)
+        self.interp_a = LinearInterpOnInterp1D(
+            [LinearInterp(x, x * (1.0 + y)) for y in self.y_values], self.y_values
+        )
+        self.interp_b = LinearInterpOnInterp1D(
+            [LinearInterp(x + 0.1 * y, x**0.5 + y) for y in self.y_values],
+            self.y_values,
+        )
+
+    def test_distance(self):
+        self.assertEqual(self.interp_a.distance(self.interp_a), 0.0)
+        self.assertEqual(
+            self.interp_a.distance(self.interp_b),
+            MetricObject.distance(self.interp_a, self.interp_b),
+        )
+
+    def test_distance_uneven_grids(self):
+        x = np.linspace(0.0, 10.0, 5)
+        interp_c = LinearInterpOnInterp1D(
+            [LinearInterp(x, x) for y in self.y_values], self.y_values
+        )
+        self.assertEqual(
+            self.interp_a.distance(interp_c),
+            MetricObject.distance(self.interp_a, interp_c),
+        )